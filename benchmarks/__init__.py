@@ -0,0 +1,3 @@
+"""Performance benchmarks for the tcod roguelike hot paths."""
+
+from __future__ import annotations
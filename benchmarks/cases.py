@@ -0,0 +1,257 @@
+"""Benchmark case definitions.
+
+Each case has a setup function that builds whatever game state it needs and
+returns the zero-argument callable that is actually timed. Cases are generated
+across map sizes and entity densities so regressions show up where they scale.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import numpy as np
+import tcod.console
+
+import entity_factories
+import snapshot
+from config import GameConfig
+from engine import Engine
+from map_objects.procgen import generate_dungeon
+from message_log import MessageLog
+from setup_game import new_game
+
+# Fixed seed so every run times the same floors.
+SEED = 1234
+
+MAP_SIZES: dict[str, tuple[int, int]] = {
+    'small': (80, 50),
+    'large': (200, 200),
+}
+
+MONSTERS_PER_ROOM: dict[str, int] = {
+    'sparse': 2,
+    'dense': 10,
+}
+
+MONSTER_COUNTS: dict[str, int] = {
+    'sparse': 100,
+    'dense': 1000,
+}
+
+MESSAGE_COUNTS: list[int] = [100, 10_000]
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    """A named benchmark and the setup that produces its timed callable."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    params: dict[str, object] = field(default_factory=dict)
+
+
+def make_config(size: str, monsters_per_room: int = 0) -> GameConfig:
+    """Return a config for the given map size, scaling room count with area."""
+    width, height = MAP_SIZES[size]
+    return GameConfig(
+        map_width=width,
+        map_height=height,
+        max_rooms=width * height // 130,
+        max_monsters_per_room=monsters_per_room,
+        seed=SEED,
+    )
+
+
+def make_stress_floor(size: str, monsters: int) -> Engine:
+    """Generate a floor and pack it with orcs on random free floor tiles."""
+    engine = new_game(make_config(size))
+    game_map = engine.game_map
+
+    # Keep the player alive however long the horde attacks.
+    engine.player.fighter.max_hp = engine.player.fighter.hp = 10**9
+
+    free_tiles = [
+        (int(x), int(y)) for x, y in np.argwhere(game_map.tiles['walkable'])
+        if (x, y) != (engine.player.x, engine.player.y)
+    ]
+    for x, y in engine.rng.sample(free_tiles, min(monsters, len(free_tiles))):
+        entity_factories.ORC_TEMPLATE.spawn(game_map, x, y)
+    engine.update_fov()
+    return engine
+
+
+def setup_generate_dungeon(size: str, density: str) -> Callable[[], object]:
+    """Time generating a whole floor."""
+    config = make_config(size, MONSTERS_PER_ROOM[density])
+    engine = new_game(make_config(size))
+
+    def run() -> object:
+        # Reseed so every timed run generates the same floor.
+        engine.rng.seed(SEED)
+        return generate_dungeon(
+            max_rooms=config.max_rooms,
+            room_min_size=config.room_min_size,
+            room_max_size=config.room_max_size,
+            map_width=config.map_width,
+            map_height=config.map_height,
+            max_monsters_per_room=config.max_monsters_per_room,
+            max_items_per_room=config.max_items_per_room,
+            engine=engine,
+        )
+
+    return run
+
+
+def setup_update_fov(size: str, density: str) -> Callable[[], object]:
+    """Time recomputing the player's field of view after a move."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    game_map = engine.game_map
+    player = engine.player
+
+    # Alternate between the start tile and a walkable neighbour so every call does real work.
+    start = player.position
+    neighbour = next(
+        (player.x + dx, player.y + dy)
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1))
+        if game_map.tiles['walkable'][player.x + dx, player.y + dy]
+    )
+
+    def run() -> None:
+        player.place(*(neighbour if player.position == start else start))
+        engine.update_fov()
+
+    return run
+
+
+def setup_enemy_turns(size: str, density: str) -> Callable[[], object]:
+    """Time one enemy turn with monster sight reaching across the whole map and no monster parked."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    engine.config = replace(engine.config, monster_sight_radius=0, activity_radius=0)
+    return engine.handle_enemy_turns
+
+
+def setup_area_query(size: str, density: str) -> Callable[[], object]:
+    """Time a fireball-sized area query around the player."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    player = engine.player
+    return lambda: engine.game_map.get_actors_in_radius(player.x, player.y, 3)
+
+
+def setup_nearest_query(size: str, density: str) -> Callable[[], object]:
+    """Time the auto-targeting query used by lightning and the bots."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    player = engine.player
+    return lambda: engine.game_map.get_nearest_visible_actor(player.x, player.y, 6, exclude=player)
+
+
+def setup_render_map(size: str, density: str, *, fov_changed: bool) -> Callable[[], object]:
+    """Time drawing the map, either idle or right after an FOV change."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    game_map = engine.game_map
+    console = tcod.console.Console(game_map.width, game_map.height, order='F')
+
+    def run() -> None:
+        if fov_changed:
+            game_map.mark_visibility_changed()
+        game_map.render(console)
+
+    return run
+
+
+def setup_snapshot(size: str, density: str, *, decode: bool) -> Callable[[], object]:
+    """Time encoding a stress floor to a save snapshot, or decoding it again."""
+    engine = make_stress_floor(size, MONSTER_COUNTS[density])
+    if not decode:
+        return lambda: snapshot.encode(engine)
+    data = snapshot.encode(engine)
+    return lambda: snapshot.decode(data, engine.config)
+
+
+def setup_message_log_render(messages: int, *, log_changed: bool) -> Callable[[], object]:
+    """Time drawing the message panel with a long log, either idle or right after a new message."""
+    log = MessageLog()
+    for index in range(messages):
+        log.add_message(f'The orc attacks the player for {index % 7} hit points, a long line to wrap.')
+    console = tcod.console.Console(80, 60, order='F')
+
+    def run() -> None:
+        if log_changed:
+            log.add_message('The orc attacks the player for 3 hit points, a long line to wrap.', stack=False)
+        log.render(console, x=21, y=51, width=40, height=9)
+
+    return run
+
+
+def build_benchmarks() -> list[Benchmark]:
+    """Return every benchmark case across sizes and densities."""
+    benchmarks: list[Benchmark] = []
+    for size in MAP_SIZES:
+        for density in MONSTERS_PER_ROOM:
+            params = {'size': size, 'density': density}
+            benchmarks += [
+                Benchmark(
+                    f'generate_dungeon[{size}-{density}]',
+                    lambda s=size, d=density: setup_generate_dungeon(s, d),
+                    params,
+                ),
+                Benchmark(
+                    f'update_fov[{size}-{density}]',
+                    lambda s=size, d=density: setup_update_fov(s, d),
+                    params,
+                ),
+                Benchmark(
+                    f'handle_enemy_turns[{size}-{density}]',
+                    lambda s=size, d=density: setup_enemy_turns(s, d),
+                    params,
+                ),
+                Benchmark(
+                    f'actors_in_radius[{size}-{density}]',
+                    lambda s=size, d=density: setup_area_query(s, d),
+                    params,
+                ),
+                Benchmark(
+                    f'nearest_visible_actor[{size}-{density}]',
+                    lambda s=size, d=density: setup_nearest_query(s, d),
+                    params,
+                ),
+                Benchmark(
+                    f'render_map_idle[{size}-{density}]',
+                    lambda s=size, d=density: setup_render_map(s, d, fov_changed=False),
+                    params,
+                ),
+                Benchmark(
+                    f'render_map_fov_changed[{size}-{density}]',
+                    lambda s=size, d=density: setup_render_map(s, d, fov_changed=True),
+                    params,
+                ),
+                Benchmark(
+                    f'snapshot_encode[{size}-{density}]',
+                    lambda s=size, d=density: setup_snapshot(s, d, decode=False),
+                    params,
+                ),
+                Benchmark(
+                    f'snapshot_decode[{size}-{density}]',
+                    lambda s=size, d=density: setup_snapshot(s, d, decode=True),
+                    params,
+                ),
+            ]
+    for count in MESSAGE_COUNTS:
+        benchmarks += [
+            Benchmark(
+                f'message_log_render[{count}]',
+                lambda c=count: setup_message_log_render(c, log_changed=False),
+                {'messages': count},
+            ),
+            Benchmark(
+                f'message_log_render_changed[{count}]',
+                lambda c=count: setup_message_log_render(c, log_changed=True),
+                {'messages': count},
+            ),
+        ]
+    return benchmarks
@@ -0,0 +1,54 @@
+"""Memory footprint benchmarks for entities.
+
+Each case reports the bytes allocated per entity while building a batch of
+them from a template, as traced by tracemalloc.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import entity_factories
+
+SAMPLE_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryBenchmark:
+    """A named measurement returning bytes per entity."""
+
+    name: str
+    measure: Callable[[], float]
+
+
+def bytes_per_entity(create: Callable[[], object], count: int = SAMPLE_SIZE) -> float:
+    """Return the average bytes allocated per entity over `count` creations."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [create() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before - sys.getsizeof(entities)) / count
+
+
+def build_memory_benchmarks() -> list[MemoryBenchmark]:
+    """Return every memory benchmark case."""
+    return [
+        MemoryBenchmark('bytes_per_actor[orc]', lambda: bytes_per_entity(entity_factories.ORC_TEMPLATE.create)),
+        MemoryBenchmark('bytes_per_actor[player]', lambda: bytes_per_entity(entity_factories.PLAYER_TEMPLATE.create)),
+        MemoryBenchmark(
+            'bytes_per_item[health_potion]',
+            lambda: bytes_per_entity(entity_factories.HEALTH_POTION_TEMPLATE.create),
+        ),
+    ]
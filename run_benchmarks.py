@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+"""Benchmark runner for the tcod roguelike hot paths.
+
+Times turn processing, rendering and dungeon generation across map sizes and
+entity densities, measures bytes per entity, writes machine-readable JSON
+results, and compares them against a stored baseline.
+
+Usage:
+    # Run all benchmarks
+    python run_benchmarks.py
+
+    # Run benchmarks whose name contains a substring
+    python run_benchmarks.py handle_enemy_turns
+
+    # Write results as JSON
+    python run_benchmarks.py --output results.json
+
+    # Record the current numbers as the baseline
+    python run_benchmarks.py --save-baseline
+
+    # List all available benchmarks
+    python run_benchmarks.py --list
+
+Examples:
+    $ python run_benchmarks.py update_fov
+    update_fov[small-sparse]                      0.112 ms   (baseline 0.110 ms, +1.8%)
+    ...
+
+Exit code is 1 if any benchmark's median time or bytes per entity exceeds its
+baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from benchmarks.cases import Benchmark, build_benchmarks
+from benchmarks.memory import MemoryBenchmark, build_memory_benchmarks
+
+DEFAULT_BASELINE = Path(__file__).parent / 'benchmarks' / 'baseline.json'
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, float | int]:
+    """Set up a benchmark, warm it up once, and time `repeat` calls.
+
+    Args:
+        benchmark: The benchmark to run
+        repeat: Number of timed calls
+
+    Returns:
+        Timing statistics in seconds
+    """
+    run = benchmark.setup()
+    run()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'runs': repeat,
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'mean_s': statistics.fmean(timings),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float | int]],
+    baseline: dict[str, dict[str, float | int]],
+    tolerance: float,
+    metric: str = 'median_s',
+) -> list[str]:
+    """Return the names of benchmarks whose metric regressed beyond the tolerance.
+
+    Args:
+        results: Current results keyed by benchmark name
+        baseline: Baseline results keyed by benchmark name
+        tolerance: Allowed relative increase (0.25 means 25%)
+        metric: Result field to compare, where lower is better
+
+    Returns:
+        Names of regressed benchmarks
+    """
+    return [
+        name for name, result in results.items()
+        if name in baseline and result[metric] > baseline[name][metric] * (1 + tolerance)
+    ]
+
+
+def format_line(name: str, result: dict[str, float | int], baseline: dict[str, float | int] | None) -> str:
+    """Format one human-readable result line."""
+    line = f'{name:<45} {result["median_s"] * 1000:10.3f} ms'
+    if baseline:
+        before = baseline['median_s']
+        change = (result['median_s'] - before) / before * 100
+        line += f'   (baseline {before * 1000:.3f} ms, {change:+.1f}%)'
+    return line
+
+
+def format_memory_line(name: str, result: dict[str, float | int], baseline: dict[str, float | int] | None) -> str:
+    """Format one human-readable memory result line."""
+    line = f'{name:<45} {result["bytes"]:10.1f} B'
+    if baseline:
+        before = baseline['bytes']
+        change = (result['bytes'] - before) / before * 100
+        line += f'    (baseline {before:.1f} B, {change:+.1f}%)'
+    return line
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, dict[str, float | int]]]:
+    """Load a baseline report, or an empty mapping if none is stored."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def run_timings(
+    benchmarks: list[Benchmark],
+    repeat: int,
+    baseline: dict[str, dict[str, float | int]],
+) -> dict[str, dict[str, float | int]]:
+    """Time each benchmark, printing a line per result."""
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = time_benchmark(benchmark, repeat)
+        print(format_line(benchmark.name, results[benchmark.name], baseline.get(benchmark.name)))
+    return results
+
+
+def run_memory(
+    benchmarks: list[MemoryBenchmark],
+    baseline: dict[str, dict[str, float | int]],
+) -> dict[str, dict[str, float | int]]:
+    """Measure each memory benchmark, printing a line per result."""
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = {'bytes': benchmark.measure()}
+        print(format_memory_line(benchmark.name, results[benchmark.name], baseline.get(benchmark.name)))
+    return results
+
+
+def main() -> int:
+    """Main entry point for the benchmark runner.
+
+    Returns:
+        Exit code (0 for success, 1 for a regression)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Run the tcod roguelike benchmark suite',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        'filter',
+        nargs='?',
+        default='',
+        help='Only run benchmarks whose name contains this substring',
+    )
+    parser.add_argument(
+        '-r', '--repeat',
+        type=int,
+        default=5,
+        help='Timed runs per benchmark',
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=Path,
+        help='Write results as JSON to this file',
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help='Baseline JSON file to compare against',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store these results as the new baseline',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='Allowed relative slowdown before a benchmark counts as regressed',
+    )
+    parser.add_argument(
+        '--list',
+        action='store_true',
+        help='List all available benchmarks without running them',
+    )
+
+    args = parser.parse_args()
+
+    benchmarks = [benchmark for benchmark in build_benchmarks() if args.filter in benchmark.name]
+    memory_benchmarks = [benchmark for benchmark in build_memory_benchmarks() if args.filter in benchmark.name]
+
+    if args.list:
+        print("Available benchmarks:")
+        print("=" * 60)
+        for benchmark in [*benchmarks, *memory_benchmarks]:
+            print(f"  {benchmark.name}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    timing_baseline = baseline.get('benchmarks', {})
+    memory_baseline = baseline.get('memory', {})
+
+    results = run_timings(benchmarks, args.repeat, timing_baseline)
+    memory = run_memory(memory_benchmarks, memory_baseline)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'benchmarks': results,
+        'memory': memory,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to: {args.baseline}")
+        return 0
+
+    regressions = [
+        *compare(results, timing_baseline, args.tolerance),
+        *compare(memory, memory_baseline, args.tolerance, metric='bytes'),
+    ]
+    if regressions:
+        print("=" * 60)
+        print(f"Regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -26,3 +26,5 @@ class MeleeAction(ActionWithDirection):
             target.fighter.take_damage(damage)
         else:
             self.engine.message_log.add_message(f'{attack_desc} does no damage.', attack_color)
+
+        self.engine.make_noise(target.x, target.y, self.engine.config.combat_noise_radius)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import exceptions
 from actions.base_action import Action
+from entity import Item
 
 
 class PickupAction(Action):
@@ -14,10 +15,7 @@ class PickupAction(Action):
         actor_x, actor_y = self.entity.x, self.entity.y
         inventory = self.entity.inventory
 
-        item = next(
-            (i for i in self.engine.game_map.items if i.x == actor_x and i.y == actor_y),
-            None,
-        )
+        item = next(self.engine.game_map.get_entities_at(actor_x, actor_y, Item), None)
 
         if item is None:
             raise exceptions.ImpossibleActionError('There is nothing here to pick up.')
@@ -25,7 +23,7 @@ class PickupAction(Action):
         if inventory.full:
             raise exceptions.ImpossibleActionError('Your inventory is full.')
 
-        self.engine.game_map.entities.discard(item)
+        self.engine.game_map.remove_entity(item)
         item.parent = self.entity.inventory
         inventory.items.append(item)
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 import tcod.path
 
 from components.base_component import BaseComponent
@@ -17,6 +16,8 @@ if TYPE_CHECKING:
 class BaseAI(BaseComponent):
     """Base class for AI components that control actor behavior."""
 
+    __slots__ = ('entity',)
+
     entity: Actor
 
     def __init__(self, entity: Actor) -> None:
@@ -27,19 +28,25 @@ class BaseAI(BaseComponent):
         """Alias for entity to maintain BaseComponent compatibility."""
         return self.entity
 
+    @property
+    def is_idle(self) -> bool:
+        """Return True if this AI has nothing to do while the player is far away."""
+        return True
+
     def perform(self) -> None:
         """Perform the AI's action. Must be overridden by subclasses."""
         raise NotImplementedError()
 
-    def get_path_to(self, dest_x: int, dest_y: int) -> list[Position]:
-        """Compute a path from the entity to the destination."""
-        cost = np.array(self.entity.gamemap.tiles['walkable'], dtype=np.int8)
+    def hear_noise(self, x: int, y: int) -> None:
+        """React to a noise at the given location. Ignored by default."""
 
-        for entity in self.entity.gamemap.entities:
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                cost[entity.x, entity.y] += 10
+    def can_see_player(self) -> bool:
+        """Return True if this entity has line of sight to the player."""
+        return self.engine.can_see_player_from(self.entity.x, self.entity.y)
 
-        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
+    def get_path_to(self, dest_x: int, dest_y: int) -> list[Position]:
+        """Compute a path from the entity to the destination."""
+        graph = tcod.path.SimpleGraph(cost=self.entity.gamemap.path_cost, cardinal=2, diagonal=3)
         pathfinder = tcod.path.Pathfinder(graph)
 
         pathfinder.add_root((self.entity.x, self.entity.y))
@@ -47,3 +54,10 @@ class BaseAI(BaseComponent):
         path = pathfinder.path_to((dest_x, dest_y))[1:].tolist()
 
         return [(index[0], index[1]) for index in path]
+
+    def get_path_to_player(self) -> list[Position]:
+        """Walk downhill on the engine's shared distance map toward the player."""
+        distance = self.engine.player_distance_map
+        path = tcod.path.hillclimb2d(distance, (self.entity.x, self.entity.y), True, True)[1:].tolist()
+
+        return [(index[0], index[1]) for index in path]
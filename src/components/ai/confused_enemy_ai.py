@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING
 
 from actions import BumpAction
@@ -28,6 +27,8 @@ DIRECTIONS = [
 class ConfusedEnemy(BaseAI):
     """AI for confused enemies that stumble randomly."""
 
+    __slots__ = ('previous_ai', 'turns_remaining')
+
     def __init__(
         self,
         entity: Actor,
@@ -38,6 +39,11 @@ class ConfusedEnemy(BaseAI):
         self.previous_ai = previous_ai
         self.turns_remaining = turns_remaining
 
+    @property
+    def is_idle(self) -> bool:
+        """Confused enemies keep stumbling until the confusion wears off."""
+        return False
+
     def perform(self) -> None:
         """Move randomly or revert to previous AI when confusion ends."""
         if self.turns_remaining <= 0:
@@ -46,6 +52,6 @@ class ConfusedEnemy(BaseAI):
             if self.previous_ai:
                 self.previous_ai.perform()
         else:
-            direction_x, direction_y = random.choice(DIRECTIONS)
+            direction_x, direction_y = self.engine.rng.choice(DIRECTIONS)
             self.turns_remaining -= 1
             BumpAction(self.entity, direction_x, direction_y).perform()
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 from actions import MeleeAction, MovementAction, WaitAction
 from components.ai.base_ai import BaseAI
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from entity.actor import Actor
     from game_types import Position
 
@@ -15,9 +18,22 @@ if TYPE_CHECKING:
 class HostileEnemy(BaseAI):
     """AI for enemies that actively hunt the player."""
 
+    __slots__ = ('path',)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__(entity)
-        self.path: list[Position] = []
+        # Steps still to take, or None; most monsters never plan a path, so the deque is made on demand.
+        self.path: deque[Position] | None = None
+
+    @property
+    def is_idle(self) -> bool:
+        """Hostile enemies stay active while they still have somewhere to go."""
+        return not self.path
+
+    def hear_noise(self, x: int, y: int) -> None:
+        """Head toward a noise unless already chasing something."""
+        if not self.path and self.engine.take_path_replan():
+            self.set_path(self.get_path_to(x, y))
 
     def perform(self) -> None:
         """Chase and attack the player."""
@@ -26,14 +42,18 @@ class HostileEnemy(BaseAI):
         dy = target.y - self.entity.y
         distance = max(abs(dx), abs(dy))  # Chebyshev distance
 
-        if self.engine.game_map.visible[self.entity.x, self.entity.y]:
+        if self.can_see_player():
             if distance <= 1:
                 MeleeAction(self.entity, dx, dy).perform()
                 return
-            self.path = self.get_path_to(target.x, target.y)
+            self.update_path(target)
+        elif self.path and not self._can_step_to(self.path[0]):
+            self._reroute()
 
-        if self.path:
-            dest_x, dest_y = self.path.pop(0)
+        if self.path and self._can_step_to(self.path[0]):
+            dest_x, dest_y = self.path.popleft()
+            if not self.path:
+                self.path = None
             MovementAction(
                 self.entity,
                 dest_x - self.entity.x,
@@ -41,3 +61,46 @@ class HostileEnemy(BaseAI):
             ).perform()
             return
         WaitAction(self.entity).perform()
+
+    def update_path(self, target: Actor) -> None:
+        """Keep the current path if it still leads to the target, otherwise replan.
+
+        A path whose end is next to the target's new position is extended by one
+        step. Replanning spends from the engine's per-turn budget; when that is
+        used up the old path is kept until a later turn.
+        """
+        if self.path and self._can_step_to(self.path[0]):
+            end_x, end_y = self.path[-1]
+            if (end_x, end_y) == target.position:
+                return
+            if max(abs(target.x - end_x), abs(target.y - end_y)) <= 1:
+                self.path.append(target.position)
+                return
+        if self.engine.take_path_replan():
+            self.set_path(self.get_path_to_player())
+
+    def set_path(self, steps: Iterable[Position]) -> None:
+        """Follow the given steps, or no path at all when there are none."""
+        self.path = deque(steps) or None
+
+    def _reroute(self) -> None:
+        """Replan a blocked path toward where it was heading, or give it up.
+
+        The path is dropped when the replan budget is used up or the new path
+        is blocked too, so a stale path never keeps a monster waiting forever.
+        """
+        goal_x, goal_y = self.path[-1]
+        if self.engine.take_path_replan():
+            self.set_path(self.get_path_to(goal_x, goal_y))
+        if self.path and not self._can_step_to(self.path[0]):
+            self.path = None
+
+    def _can_step_to(self, position: Position) -> bool:
+        """Return True if position is an adjacent, walkable, unoccupied tile."""
+        x, y = position
+        gamemap = self.entity.gamemap
+        return (
+            max(abs(x - self.entity.x), abs(y - self.entity.y)) == 1
+            and gamemap.tiles['walkable'][x, y]
+            and gamemap.get_blocking_entity_at_location(x, y) is None
+        )
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class BaseComponent:
     """Base class for all entity components."""
 
+    __slots__ = ()
+
     parent: Actor
 
     @property
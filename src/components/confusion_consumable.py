@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 class ConfusionConsumable(Consumable):
     """A consumable that confuses the target for a number of turns."""
 
+    __slots__ = ('number_of_turns',)
+
     def __init__(self, number_of_turns: int) -> None:
         self.number_of_turns = number_of_turns
 
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class Consumable(BaseComponent):
     """Base class for consumable item components."""
 
+    __slots__ = ('parent',)
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> ActionOrHandler:
@@ -15,13 +15,15 @@ if TYPE_CHECKING:
 class Fighter(BaseComponent):
     """Component for entities that can engage in combat."""
 
+    __slots__ = ('parent', '_max_hp', '_hp', '_defense', '_power')
+
     parent: Actor
 
     def __init__(self, hp: int, defense: int, power: int) -> None:
-        self.max_hp = hp
+        self._max_hp = hp
         self._hp = hp
-        self.defense = defense
-        self.power = power
+        self._defense = defense
+        self._power = power
 
     @property
     def hp(self) -> int:
@@ -30,9 +32,44 @@ class Fighter(BaseComponent):
     @hp.setter
     def hp(self, value: int) -> None:
         self._hp = max(0, min(value, self.max_hp))
+        self._sync()
         if self._hp == 0 and self.parent.ai:
             self.die()
 
+    @property
+    def max_hp(self) -> int:
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value: int) -> None:
+        self._max_hp = value
+        self._sync()
+
+    @property
+    def defense(self) -> int:
+        return self._defense
+
+    @defense.setter
+    def defense(self, value: int) -> None:
+        self._defense = value
+        self._sync()
+
+    @property
+    def power(self) -> int:
+        return self._power
+
+    @power.setter
+    def power(self, value: int) -> None:
+        self._power = value
+        self._sync()
+
+    def _sync(self) -> None:
+        """Write the stats through to the actor store of the map the parent stands on."""
+        actor = getattr(self, 'parent', None)
+        gamemap = actor._parent_map() if actor is not None else None
+        if gamemap is not None:
+            gamemap.actor_store.update_fighter(actor)
+
     def die(self) -> None:
         """Handle the death of the entity."""
         if self.engine.player is self.parent:
@@ -48,6 +85,8 @@ class Fighter(BaseComponent):
         self.parent.ai = None
         self.parent.name = f'remains of {self.parent.name}'
         self.parent.render_order = RenderOrder.CORPSE
+        self.gamemap.update_entity(self.parent)
+        self.engine.scheduler.unschedule(self.parent)
 
         self.engine.message_log.add_message(death_message, death_message_color)
 
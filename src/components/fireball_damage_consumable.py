@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 class FireballDamageConsumable(Consumable):
     """A consumable that deals fire damage in an area."""
 
+    __slots__ = ('damage', 'radius')
+
     def __init__(self, damage: int, radius: int) -> None:
         self.damage = damage
         self.radius = radius
@@ -41,16 +43,16 @@ class FireballDamageConsumable(Consumable):
             raise exceptions.ImpossibleActionError('You cannot target an area you cannot see.')
 
         targets_hit = False
-        for actor in self.engine.game_map.actors:
+        for actor in self.engine.game_map.get_actors_in_radius(*target_xy, self.radius):
             if actor is consumer:
                 continue
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f'The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!'
-                )
-                actor.fighter.take_damage(self.damage)
-                targets_hit = True
+            self.engine.message_log.add_message(
+                f'The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!'
+            )
+            actor.fighter.take_damage(self.damage)
+            targets_hit = True
 
         if not targets_hit:
             raise exceptions.ImpossibleActionError('There are no targets in the radius.')
+        self.engine.make_noise(*target_xy, self.engine.config.combat_noise_radius)
         self.consume()
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class HealingConsumable(Consumable):
     """A consumable that heals the user."""
 
+    __slots__ = ('amount',)
+
     def __init__(self, amount: int) -> None:
         self.amount = amount
 
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class Inventory(BaseComponent):
     """Component for entities that can hold items."""
 
+    __slots__ = ('parent', 'capacity', 'items')
+
     parent: Actor
 
     def __init__(self, capacity: int) -> None:
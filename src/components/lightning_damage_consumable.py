@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class LightningDamageConsumable(Consumable):
     """A consumable that strikes the closest visible enemy with lightning."""
 
+    __slots__ = ('damage', 'maximum_range')
+
     def __init__(self, damage: int, maximum_range: int) -> None:
         self.damage = damage
         self.maximum_range = maximum_range
@@ -21,16 +23,12 @@ class LightningDamageConsumable(Consumable):
     def activate(self, action: ItemAction) -> None:
         """Strike the nearest visible enemy with lightning."""
         consumer = action.entity
-        target = None
-        closest_distance = self.maximum_range + 1.0
-
-        for actor in self.engine.game_map.actors:
-            if actor is not consumer and self.parent.gamemap.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
-
-                if distance < closest_distance:
-                    target = actor
-                    closest_distance = distance
+        target = self.engine.game_map.get_nearest_visible_actor(
+            consumer.x,
+            consumer.y,
+            max_distance=self.maximum_range + 1.0,
+            exclude=consumer,
+        )
 
         if target:
             self.engine.message_log.add_message(
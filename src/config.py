@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,13 +23,23 @@ class GameConfig:
     max_items_per_room: int = 2
 
     fov_radius: int = 8
+    monster_sight_radius: int = 10
+    max_path_replans_per_turn: int = 50
+    activity_radius: int = 20  # Idle monsters farther than this (and out of sight) stop taking turns
+    combat_noise_radius: int = 8
 
     message_box_x: int = 21
     message_box_y: int = 51
     message_box_width: int = 40
     message_box_height: int = 9
+    message_log_capacity: int = 1000
+    message_journal_path: Path | None = None  # Where messages dropped from the log are kept, if anywhere
 
     health_bar_width: int = 20
 
+    seed: int | None = None
+    save_path: Path = Path('savegame.sav')
+    map_storage_dir: Path | None = None  # Memory-map map layers to files here instead of holding them in RAM
+
 
 DEFAULT_CONFIG = GameConfig()
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import random
 from typing import TYPE_CHECKING
 
+import numpy as np
+import tcod.path
 from tcod.map import compute_fov
 
 import exceptions
 from config import DEFAULT_CONFIG
 from input_handlers import MainGameEventHandler
+from map_objects.actor_store import DistanceMetric
 from message_log import MessageLog
-from render_functions import render_bar, render_names_at_mouse_location
+from render_functions import PanelPool, render_bar, render_names_at_mouse_location
+from turn_scheduler import TurnScheduler, action_delay
 
 if TYPE_CHECKING:
     from tcod.console import Console
@@ -23,14 +28,122 @@ if TYPE_CHECKING:
 class Engine:
     """Main game engine that manages game state and rendering."""
 
-    game_map: GameMap
-
     def __init__(self, player: Actor, config: GameConfig = DEFAULT_CONFIG) -> None:
         self.event_handler = MainGameEventHandler(self)
-        self.message_log = MessageLog()
+        self.message_log = MessageLog(config.message_log_capacity, config.message_journal_path)
+        self.panels = PanelPool()
         self.player = player
         self.mouse_location = (0, 0)
         self.config = config
+        self.rng = random.Random(config.seed)
+        self.scheduler = TurnScheduler()
+        self._player_distance: np.ndarray | None = None
+        self._player_distance_origin: tuple[GameMap, int, int] | None = None
+        self._fov_origin: tuple[GameMap, int, int, int] | None = None
+        self.path_replans_remaining = config.max_path_replans_per_turn
+        self._player_sight: tuple[np.ndarray, int, int] | None = None
+        self._player_sight_origin: tuple[GameMap, int, int, int] | None = None
+
+    @property
+    def game_map(self) -> GameMap:
+        return self._game_map
+
+    @game_map.setter
+    def game_map(self, game_map: GameMap) -> None:
+        """Switch floors, scheduling every monster on the new map to act next."""
+        self._game_map = game_map
+        game_map.take_arrivals()
+        self.scheduler = TurnScheduler(actor for actor in game_map.actors if actor is not self.player)
+
+    @property
+    def player_distance_map(self) -> np.ndarray:
+        """Return a Dijkstra distance map rooted at the player.
+
+        The map is shared by every AI and computed at most once per enemy turn,
+        or again if the player has moved since it was built.
+        """
+        origin = (self.game_map, self.player.x, self.player.y)
+        if self._player_distance is None or self._player_distance_origin != origin:
+            cost = self.game_map.path_cost
+            distance = tcod.path.maxarray(cost.shape, order='F')
+            distance[self.player.x, self.player.y] = 0
+            tcod.path.dijkstra2d(distance, cost, 2, 3, out=distance)
+            self._player_distance = distance
+            self._player_distance_origin = origin
+        return self._player_distance
+
+    def make_noise(self, x: int, y: int, radius: int) -> None:
+        """Wake dormant monsters within earshot of (x, y) and let them react to the sound."""
+        scheduler = self.scheduler
+        for actor in self.game_map.get_actors_in_radius(x, y, radius):
+            if actor is not self.player:
+                scheduler.wake(actor)
+                actor.ai.hear_noise(x, y)
+
+    @property
+    def activity_radius(self) -> int:
+        """Return the radius beyond which idle monsters are parked, or 0 to keep all of them active.
+
+        It is never smaller than the monster sight radius, so a monster that can
+        see the player is always in range, and unlimited sight disables parking.
+        """
+        radius = self.config.activity_radius
+        sight = self.config.monster_sight_radius
+        if radius <= 0 or sight <= 0:
+            return 0
+        return max(radius, sight)
+
+    def _wake_nearby(self) -> None:
+        """Wake dormant monsters that are back inside the activity radius."""
+        radius = self.activity_radius
+        if not self.scheduler.dormant or radius <= 0:
+            return
+        nearby = self.game_map.get_actors_in_radius(self.player.x, self.player.y, radius, DistanceMetric.CHEBYSHEV)
+        for actor in nearby:
+            self.scheduler.wake(actor)
+
+    def _is_out_of_activity_range(self, actor: Actor) -> bool:
+        """Return True if an actor is farther from the player than the activity radius."""
+        radius = self.activity_radius
+        return radius > 0 and max(abs(actor.x - self.player.x), abs(actor.y - self.player.y)) > radius
+
+    def take_path_replan(self) -> bool:
+        """Spend one of this enemy turn's path replans. Returns False once they are used up."""
+        if self.path_replans_remaining <= 0:
+            return False
+        self.path_replans_remaining -= 1
+        return True
+
+    def can_see_player_from(self, x: int, y: int) -> bool:
+        """Return True if a monster standing at (x, y) can see the player.
+
+        Sight lines from every monster are answered by one reverse FOV from the
+        player, using the monster sight radius, which is recomputed only after
+        the player moves or tiles change.
+        """
+        origin = (self.game_map, self.player.x, self.player.y, self.game_map.tiles_version)
+        if self._player_sight is None or self._player_sight_origin != origin:
+            window, sight = self._compute_fov_window(self.config.monster_sight_radius)
+            self._player_sight = (sight, window[0].start, window[1].start)
+            self._player_sight_origin = origin
+        sight, x0, y0 = self._player_sight
+        x, y = x - x0, y - y0
+        return 0 <= x < sight.shape[0] and 0 <= y < sight.shape[1] and bool(sight[x, y])
+
+    def _compute_fov_window(self, radius: int) -> tuple[tuple[slice, slice], np.ndarray]:
+        """Compute the player's FOV over just the window the radius can reach.
+
+        A radius of 0 or less covers the whole map.
+        """
+        game_map = self.game_map
+        x, y = self.player.x, self.player.y
+        if radius > 0:
+            x0, y0 = max(0, x - radius), max(0, y - radius)
+            x1, y1 = min(game_map.width, x + radius + 1), min(game_map.height, y + radius + 1)
+        else:
+            x0, y0, x1, y1 = 0, 0, game_map.width, game_map.height
+        window = (slice(x0, x1), slice(y0, y1))
+        return window, compute_fov(game_map.tiles['transparent'][window], (x - x0, y - y0), radius=radius)
 
     def render(self, console: Console) -> None:
         """Render the game state to the console."""
@@ -59,19 +172,44 @@ class Engine:
         )
 
     def update_fov(self) -> None:
-        """Recompute the visible area based on the player's point of view."""
-        self.game_map.visible[:] = compute_fov(
-            self.game_map.tiles['transparent'],
-            (self.player.x, self.player.y),
-            radius=self.config.fov_radius,
-        )
-        self.game_map.explored |= self.game_map.visible
+        """Recompute the visible area and the entities in view from the player's point of view.
+
+        The FOV is only recomputed when the player moved or tiles changed, and
+        only over the window the FOV radius can reach.
+        """
+        game_map = self.game_map
+        origin = (game_map, self.player.x, self.player.y, game_map.tiles_version)
+        if origin != self._fov_origin:
+            self._fov_origin = origin
+            game_map.update_visible(*self._compute_fov_window(self.config.fov_radius))
+        game_map.update_visible_entities()
 
     def handle_enemy_turns(self) -> None:
-        """Process AI turns for all enemies."""
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
-                try:
-                    entity.ai.perform()
-                except exceptions.ImpossibleActionError:
-                    pass
+        """Let every monster due before the player's next action take its turns.
+
+        Monsters act in order of their scheduled time, so faster monsters may act
+        several times per player action and slower ones less often. Dead or
+        removed monsters drop out of the schedule when their entry comes up.
+        """
+        self._player_distance = None
+        self.path_replans_remaining = self.config.max_path_replans_per_turn
+        scheduler = self.scheduler
+        for actor in self.game_map.take_arrivals():
+            if actor is not self.player:
+                scheduler.schedule(actor)
+        self._wake_nearby()
+
+        end_time = scheduler.time + action_delay(self.player.speed)
+        while (due := scheduler.pop_due(end_time)) is not None:
+            actor, time = due
+            if not actor.is_alive or actor.parent is not self.game_map:
+                continue
+            if actor.ai.is_idle and self._is_out_of_activity_range(actor):
+                scheduler.park(actor)
+                continue
+            try:
+                actor.ai.perform()
+            except exceptions.ImpossibleActionError:
+                pass
+            scheduler.schedule(actor, time + action_delay(actor.speed))
+        scheduler.time = end_time
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from entity.base_entity import Entity
 from render_order import RenderOrder
+from turn_scheduler import NORMAL_SPEED
 
 if TYPE_CHECKING:
     from components.ai.base_ai import BaseAI
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 class Actor(Entity):
     """A living entity that can perform actions."""
 
+    __slots__ = ('_ai', 'fighter', 'inventory', 'speed')
+
     def __init__(
         self,
         *,
@@ -28,6 +31,7 @@ class Actor(Entity):
         ai_cls: type[BaseAI],
         fighter: Fighter,
         inventory: Inventory,
+        speed: int = NORMAL_SPEED,
     ) -> None:
         super().__init__(
             x=x,
@@ -39,13 +43,26 @@ class Actor(Entity):
             render_order=RenderOrder.ACTOR,
         )
 
-        self.ai: BaseAI | None = ai_cls(self)
+        self.ai = ai_cls(self)
         self.fighter = fighter
         self.fighter.parent = self
 
         self.inventory = inventory
         self.inventory.parent = self
 
+        self.speed = speed
+
+    @property
+    def ai(self) -> BaseAI | None:
+        return self._ai
+
+    @ai.setter
+    def ai(self, value: BaseAI | None) -> None:
+        self._ai = value
+        gamemap = self._parent_map()
+        if gamemap is not None:
+            gamemap.actor_store.update_ai(self)
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class Entity:
     """A generic object to represent players, enemies, items, etc."""
 
+    __slots__ = ('x', 'y', 'icon', 'color', 'name', 'blocks_movement', 'render_order', 'parent')
+
     parent: GameMap | None
 
     def __init__(
@@ -38,7 +40,7 @@ class Entity:
         self.render_order = render_order
         if parent:
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
@@ -55,18 +57,28 @@ class Entity:
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, gamemap: GameMap | None = None) -> None:
         """Place this entity at a new location, optionally on a new game map."""
+        current_map = self._parent_map()
         self.x = x
         self.y = y
         if gamemap:
-            if hasattr(self, 'parent') and self.parent is self.gamemap:
-                self.gamemap.entities.discard(self)
+            if current_map is not None:
+                current_map.remove_entity(self)
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        elif current_map is not None:
+            current_map.update_entity(self)
+
+    def _parent_map(self) -> GameMap | None:
+        """Return the parent if this entity sits directly on a game map."""
+        parent = getattr(self, 'parent', None)
+        if parent is not None and parent is self.gamemap:
+            return parent
+        return None
 
     def distance(self, x: int, y: int) -> float:
         """Return the distance from this entity to the given coordinates."""
@@ -76,3 +88,6 @@ class Entity:
         """Move the entity by the given amount."""
         self.x += dx
         self.y += dy
+        gamemap = self._parent_map()
+        if gamemap is not None:
+            gamemap.update_entity(self)
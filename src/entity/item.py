@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class Item(Entity):
     """An entity that can be picked up and used."""
 
+    __slots__ = ('consumable',)
+
     def __init__(
         self,
         *,
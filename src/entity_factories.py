@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 from components.ai import BaseAI, HostileEnemy
@@ -13,10 +15,12 @@ from components.healing_consumable import HealingConsumable
 from components.inventory import Inventory
 from components.lightning_damage_consumable import LightningDamageConsumable
 from entity import Actor, Item
+from turn_scheduler import NORMAL_SPEED
 
 if TYPE_CHECKING:
     from components.consumable import Consumable
     from game_types import ColorRGB
+    from map_objects.game_map import GameMap
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,6 +35,7 @@ class ActorTemplate:
     defense: int
     power: int
     inventory_capacity: int = 0
+    speed: int = NORMAL_SPEED
 
     def create(self) -> Actor:
         """Create an Actor from this template."""
@@ -41,8 +46,13 @@ class ActorTemplate:
             ai_cls=self.ai_cls,
             fighter=Fighter(hp=self.hp, defense=self.defense, power=self.power),
             inventory=Inventory(capacity=self.inventory_capacity),
+            speed=self.speed,
         )
 
+    def spawn(self, gamemap: GameMap, x: int, y: int) -> Actor:
+        """Create an Actor from this template and place it on the map."""
+        return _place_new(self.create(), gamemap, x, y)
+
 
 @dataclass(frozen=True, slots=True)
 class ItemTemplate:
@@ -51,17 +61,33 @@ class ItemTemplate:
     icon: str
     color: ColorRGB
     name: str
-    consumable: Consumable
+    consumable_factory: Callable[[], Consumable]
 
     def create(self) -> Item:
-        """Create an Item from this template."""
+        """Create an Item from this template with its own consumable."""
         return Item(
             icon=self.icon,
             color=self.color,
             name=self.name,
-            consumable=self.consumable,
+            consumable=self.consumable_factory(),
         )
 
+    def spawn(self, gamemap: GameMap, x: int, y: int) -> Item:
+        """Create an Item from this template and place it on the map."""
+        return _place_new(self.create(), gamemap, x, y)
+
+
+type EntityTemplate = ActorTemplate | ItemTemplate
+
+
+def _place_new[T: Actor | Item](entity: T, gamemap: GameMap, x: int, y: int) -> T:
+    """Put a freshly created entity on a game map."""
+    entity.x = x
+    entity.y = y
+    entity.parent = gamemap
+    gamemap.add_entity(entity)
+    return entity
+
 
 # Actor templates
 PLAYER_TEMPLATE = ActorTemplate(
@@ -95,59 +121,41 @@ TROLL_TEMPLATE = ActorTemplate(
     power=4,
 )
 
-# Actor instances (for spawning)
-player = Actor(
-    icon='@',
-    color=(255, 128, 0),
-    name='Player',
-    ai_cls=BaseAI,
-    fighter=Fighter(hp=30, defense=2, power=5),
-    inventory=Inventory(capacity=26),
-)
-
-orc = Actor(
-    icon='o',
-    color=(63, 127, 63),
-    name='Orc',
-    ai_cls=HostileEnemy,
-    fighter=Fighter(hp=10, defense=0, power=3),
-    inventory=Inventory(capacity=0),
-)
-
-troll = Actor(
-    icon='T',
-    color=(0, 127, 0),
-    name='Troll',
-    ai_cls=HostileEnemy,
-    fighter=Fighter(hp=16, defense=1, power=4),
-    inventory=Inventory(capacity=0),
-)
-
-# Item instances
-health_potion = Item(
+# Item templates
+HEALTH_POTION_TEMPLATE = ItemTemplate(
     icon='!',
     color=(128, 0, 128),
     name='Health Potion',
-    consumable=HealingConsumable(amount=4),
+    consumable_factory=partial(HealingConsumable, amount=4),
 )
 
-lightning_scroll = Item(
+LIGHTNING_SCROLL_TEMPLATE = ItemTemplate(
     icon='~',
     color=(255, 165, 83),
     name='Lightning Scroll',
-    consumable=LightningDamageConsumable(damage=20, maximum_range=5),
+    consumable_factory=partial(LightningDamageConsumable, damage=20, maximum_range=5),
 )
 
-confusion_scroll = Item(
+CONFUSION_SCROLL_TEMPLATE = ItemTemplate(
     icon='~',
     color=(207, 63, 255),
     name='Confusion Scroll',
-    consumable=ConfusionConsumable(number_of_turns=10),
+    consumable_factory=partial(ConfusionConsumable, number_of_turns=10),
 )
 
-fireball_scroll = Item(
+FIREBALL_SCROLL_TEMPLATE = ItemTemplate(
     icon='~',
     color=(255, 0, 0),
     name='Fireball Scroll',
-    consumable=FireballDamageConsumable(damage=12, radius=3),
+    consumable_factory=partial(FireballDamageConsumable, damage=12, radius=3),
 )
+
+# Prototype instances, built from the templates
+player = PLAYER_TEMPLATE.create()
+orc = ORC_TEMPLATE.create()
+troll = TROLL_TEMPLATE.create()
+
+health_potion = HEALTH_POTION_TEMPLATE.create()
+lightning_scroll = LIGHTNING_SCROLL_TEMPLATE.create()
+confusion_scroll = CONFUSION_SCROLL_TEMPLATE.create()
+fireball_scroll = FIREBALL_SCROLL_TEMPLATE.create()
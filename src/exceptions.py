@@ -7,5 +7,9 @@ class ImpossibleActionError(Exception):
     """Exception raised when an action cannot be performed."""
 
 
+class InvalidSaveError(Exception):
+    """Exception raised when a save file cannot be loaded."""
+
+
 class QuitWithoutSaving(SystemExit):
     """Exception raised to exit the game without saving."""
@@ -0,0 +1,142 @@
+"""Headless game simulation with no window, event loop or rendering.
+
+Bots stand in for the keyboard: each turn a bot looks at the engine and returns
+the next action for the player, which goes through the same
+EventHandler.handle_action path as interactive play.
+
+Usage:
+    python src/headless.py --games 100 --max-turns 500
+    python src/headless.py --games 10 --seed 42
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING
+
+from actions import BumpAction, MeleeAction, MovementAction, WaitAction
+from config import DEFAULT_CONFIG, GameConfig
+from entity import Actor
+from input_handlers import EventHandler
+from setup_game import new_game
+
+if TYPE_CHECKING:
+    from actions.base_action import Action
+    from engine import Engine
+
+type Bot = Callable[[Engine], Action | None]
+
+# Consecutive impossible actions tolerated before a game is abandoned as stuck.
+MAX_FAILED_ACTIONS = 100
+
+DIRECTIONS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    """Outcome of a single headless game."""
+
+    turns: int
+    actions: int
+    player_alive: bool
+    player_hp: int
+    monsters_killed: int
+
+
+def scripted_bot(actions: Iterable[Action]) -> Bot:
+    """Return a bot that plays the given actions in order, then stops."""
+    iterator = iter(actions)
+    return lambda engine: next(iterator, None)
+
+
+def hunter_bot(engine: Engine) -> Action:
+    """Attack the nearest visible monster, or wander when none is in view."""
+    player = engine.player
+    game_map = engine.game_map
+
+    target = game_map.get_nearest_visible_actor(player.x, player.y, exclude=player)
+    if target:
+        dx, dy = target.x - player.x, target.y - player.y
+        if max(abs(dx), abs(dy)) <= 1:
+            return MeleeAction(player, dx, dy)
+        path = player.ai.get_path_to(target.x, target.y)
+        if path:
+            dest_x, dest_y = path[0]
+            return MovementAction(player, dest_x - player.x, dest_y - player.y)
+
+    open_directions = [
+        (dx, dy) for dx, dy in DIRECTIONS
+        if game_map.in_bounds(player.x + dx, player.y + dy)
+        and game_map.tiles['walkable'][player.x + dx, player.y + dy]
+    ]
+    if not open_directions:
+        return WaitAction(player)
+    return BumpAction(player, *engine.rng.choice(open_directions))
+
+
+def run_headless(engine: Engine, bot: Bot, max_turns: int = 1000) -> SimulationResult:
+    """Drive a game with a bot until the player dies, the bot stops or max_turns pass."""
+    handler = EventHandler(engine)
+    turns = actions = failed_in_a_row = 0
+
+    while turns < max_turns and engine.player.is_alive and failed_in_a_row < MAX_FAILED_ACTIONS:
+        action = bot(engine)
+        if action is None:
+            break
+        actions += 1
+        if handler.handle_action(action):
+            turns += 1
+            failed_in_a_row = 0
+        else:
+            failed_in_a_row += 1
+    engine.message_log.close()
+
+    return SimulationResult(
+        turns=turns,
+        actions=actions,
+        player_alive=engine.player.is_alive,
+        player_hp=engine.player.fighter.hp,
+        monsters_killed=sum(
+            1 for entity in engine.game_map.entities
+            if isinstance(entity, Actor) and entity is not engine.player and not entity.is_alive
+        ),
+    )
+
+
+def simulate_games(
+    games: int,
+    config: GameConfig = DEFAULT_CONFIG,
+    bot: Bot = hunter_bot,
+    max_turns: int = 1000,
+) -> list[SimulationResult]:
+    """Play several independent headless games and return their results.
+
+    With a seeded config, game N uses seed + N so the whole batch is reproducible.
+    """
+    results = []
+    for game in range(games):
+        game_config = config if config.seed is None else replace(config, seed=config.seed + game)
+        results.append(run_headless(new_game(game_config), bot, max_turns))
+    return results
+
+
+def main() -> int:
+    """Run headless games from the command line, printing one JSON line per game."""
+    parser = argparse.ArgumentParser(description='Run headless bot-driven games')
+    parser.add_argument('--games', type=int, default=1, help='Number of games to play')
+    parser.add_argument('--max-turns', type=int, default=1000, help='Turn limit per game')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible games')
+    args = parser.parse_args()
+
+    config = replace(DEFAULT_CONFIG, seed=args.seed)
+    for result in simulate_games(args.games, config, max_turns=args.max_turns):
+        print(json.dumps(asdict(result)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -25,22 +25,29 @@ class HistoryViewer(EventHandler):
         self.cursor = self.log_length - 1
 
     def on_render(self, console: tcod.console.Console) -> None:
-        """Render the message history panel."""
+        """Render the message history panel, redrawing it only when the cursor or log changed."""
         super().on_render(console)
-        log_console = tcod.console.Console(console.width - 6, console.height - 6)
+        log_console = self.engine.panels['history'].draw(
+            console.width - 6,
+            console.height - 6,
+            (self.cursor, self.engine.message_log.version),
+            self.draw_history,
+        )
+        log_console.blit(console, 3, 3)
 
+    def draw_history(self, log_console: tcod.console.Console) -> None:
+        """Draw the frame, title and messages up to the cursor."""
         log_console.draw_frame(0, 0, log_console.width, log_console.height)
         log_console.print_box(0, 0, log_console.width, 1, '┤Message history├', alignment=tcod.constants.CENTER)
 
-        self.engine.message_log.render_messages(
+        self.engine.message_log.render_history(
             log_console,
             1,
             1,
             log_console.width - 2,
             log_console.height - 2,
-            self.engine.message_log.messages[: self.cursor + 1],
+            self.cursor + 1,
         )
-        log_console.blit(console, 3, 3)
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> ActionOrHandler:
         """Handle key presses for navigation."""
@@ -22,32 +22,39 @@ class InventoryEventHandler(AskUserEventHandler):
     TITLE = '<missing title>'
 
     def on_render(self, console: tcod.console.Console) -> None:
-        """Render the inventory menu."""
+        """Render the inventory menu from a pooled panel, redrawn only when its contents change."""
         super().on_render(console)
-        number_of_items = len(self.engine.player.inventory.items)
+        lines = tuple(
+            f'({chr(ord("a") + i)}) {item.name})' for i, item in enumerate(self.engine.player.inventory.items)
+        ) or ('(Empty)',)
 
-        height = max(3, number_of_items + 2)
+        height = len(lines) + 2
+        width = max(len(self.TITLE), *map(len, lines)) + 4
         x = 40 if self.engine.player.x <= 30 else 0
         y = 0
-        width = len(self.TITLE) + 4
 
-        console.draw_frame(
-            x=x,
-            y=y,
-            width=width,
-            height=height,
+        menu = self.engine.panels['menu'].draw(
+            width,
+            height,
+            (self.TITLE, lines),
+            lambda menu: self.draw_menu(menu, lines),
+        )
+        menu.blit(console, x, y)
+
+    def draw_menu(self, menu: tcod.console.Console, lines: tuple[str, ...]) -> None:
+        """Draw the framed item list onto the menu panel."""
+        menu.draw_frame(
+            x=0,
+            y=0,
+            width=menu.width,
+            height=menu.height,
             title=self.TITLE,
             clear=True,
             fg=(255, 255, 255),
             bg=(0, 0, 0),
         )
-
-        if number_of_items > 0:
-            for i, item in enumerate(self.engine.player.inventory.items):
-                item_key = chr(ord('a') + i)
-                console.print(x + 1, y + i + 1, f'({item_key}) {item.name})')
-        else:
-            console.print(x + 1, y + 1, '(Empty)')
+        for i, line in enumerate(lines):
+            menu.print(1, i + 1, line)
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> ActionOrHandler:
         """Handle key presses for item selection."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 import traceback
 from typing import TYPE_CHECKING
 
@@ -13,14 +12,14 @@ import tcod.event
 import tcod.tileset
 
 import color
-import entity_factories
 import exceptions
+import snapshot
 from config import DEFAULT_CONFIG, GameConfig
-from engine import Engine
 from input_handlers import EventHandler, MainGameEventHandler
-from map_objects.procgen import generate_dungeon
+from setup_game import new_game
 
 if TYPE_CHECKING:
+    from engine import Engine
     from input_handlers.base_event_handler import BaseEventHandler
 
 
@@ -46,31 +45,33 @@ def game_loop(
     return handler
 
 
+def load_or_new_game(config: GameConfig) -> Engine:
+    """Resume the saved game if there is one, otherwise start a new game."""
+    if config.save_path.exists():
+        try:
+            return snapshot.load(config.save_path, config)
+        except exceptions.InvalidSaveError:
+            traceback.print_exc()
+    return new_game(config)
+
+
+def save_game(handler: BaseEventHandler, config: GameConfig) -> None:
+    """Save the game in progress. A finished game leaves no save behind."""
+    if not isinstance(handler, EventHandler):
+        return
+    if handler.engine.player.is_alive:
+        snapshot.save(handler.engine, config.save_path)
+    else:
+        config.save_path.unlink(missing_ok=True)
+
+
 def main(config: GameConfig = DEFAULT_CONFIG) -> None:
     """Initialize and run the game."""
     tileset = tcod.tileset.load_tilesheet(
         'dejavu10x10_gs_tc.png', 32, 8, tcod.tileset.CHARMAP_TCOD
     )
 
-    player = copy.deepcopy(entity_factories.player)
-    engine = Engine(player=player, config=config)
-
-    engine.game_map = generate_dungeon(
-        max_rooms=config.max_rooms,
-        room_min_size=config.room_min_size,
-        room_max_size=config.room_max_size,
-        map_width=config.map_width,
-        map_height=config.map_height,
-        max_monsters_per_room=config.max_monsters_per_room,
-        max_items_per_room=config.max_items_per_room,
-        engine=engine,
-    )
-
-    engine.update_fov()
-    engine.message_log.add_message(
-        'Welcome to the next iteration of Super Dungeon Slaughter!',
-        color.welcome_text,
-    )
+    engine = load_or_new_game(config)
 
     handler: BaseEventHandler = MainGameEventHandler(engine)
 
@@ -88,10 +89,14 @@ def main(config: GameConfig = DEFAULT_CONFIG) -> None:
                 handler = game_loop(console, context, handler)
         except exceptions.QuitWithoutSaving:
             raise
-        except SystemExit:
+        except SystemExit:  # Save and quit.
+            save_game(handler, config)
             raise
-        except BaseException:
+        except BaseException:  # Save on any other unexpected exception.
+            save_game(handler, config)
             raise
+        finally:
+            engine.message_log.close()
 
 
 if __name__ == '__main__':
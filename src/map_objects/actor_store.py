@@ -0,0 +1,168 @@
+"""Structure-of-arrays store mirroring a map's actors for vectorized queries."""
+
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from components.ai.base_ai import BaseAI
+    from entity.actor import Actor
+
+INITIAL_CAPACITY = 64
+
+# Column name -> dtype. Every column is indexed by the actor's slot.
+COLUMNS: dict[str, type] = {
+    'x': np.int32,
+    'y': np.int32,
+    'hp': np.int32,
+    'max_hp': np.int32,
+    'power': np.int32,
+    'defense': np.int32,
+    'alive': np.bool_,
+    'blocks': np.bool_,
+    'ai_kind': np.int16,
+}
+
+
+class DistanceMetric(Enum):
+    """How distance is measured for area queries."""
+
+    EUCLIDEAN = auto()
+    CHEBYSHEV = auto()
+
+
+class ActorStore:
+    """Columns of actor state (position, combat stats, alive, blocks, AI kind).
+
+    The Actor and Fighter objects stay authoritative: they write their changes
+    through to the store, so reads here are always current and queries over all
+    actors become array masks. Slots are packed; removing an actor moves the
+    last actor into its slot.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._actors: list[Actor] = []
+        self._slots: dict[Actor, int] = {}
+        # AI class -> small integer code, with 0 reserved for "no AI".
+        self._ai_kinds: dict[type[BaseAI] | None, int] = {None: 0}
+        self._columns = {name: np.zeros(INITIAL_CAPACITY, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, actor: object) -> bool:
+        return actor in self._slots
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view of one column trimmed to the stored actors."""
+        return self._columns[name][:self.count]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.column('x')
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.column('y')
+
+    @property
+    def hp(self) -> np.ndarray:
+        return self.column('hp')
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.column('alive')
+
+    def ai_kind(self, ai_cls: type[BaseAI] | None) -> int:
+        """Return the integer code stored for an AI class."""
+        return self._ai_kinds.setdefault(ai_cls, len(self._ai_kinds))
+
+    def update(self, actor: Actor) -> None:
+        """Add an actor or refresh every column from its current state."""
+        slot = self._slots.get(actor)
+        if slot is None:
+            slot = self._append(actor)
+
+        columns = self._columns
+        columns['x'][slot] = actor.x
+        columns['y'][slot] = actor.y
+        columns['blocks'][slot] = actor.blocks_movement
+        self._write_ai(slot, actor)
+        self._write_fighter(slot, actor)
+
+    def update_ai(self, actor: Actor) -> None:
+        """Refresh the alive and AI kind columns after the actor's AI changed."""
+        slot = self._slots.get(actor)
+        if slot is not None:
+            self._write_ai(slot, actor)
+
+    def update_fighter(self, actor: Actor) -> None:
+        """Refresh the combat stat columns after the actor's fighter changed."""
+        slot = self._slots.get(actor)
+        if slot is not None:
+            self._write_fighter(slot, actor)
+
+    def remove(self, actor: Actor) -> None:
+        """Stop tracking an actor, moving the last actor into its slot."""
+        slot = self._slots.pop(actor, None)
+        if slot is None:
+            return
+        last = self.count - 1
+        moved = self._actors.pop()
+        if slot != last:
+            self._actors[slot] = moved
+            self._slots[moved] = slot
+            for column in self._columns.values():
+                column[slot] = column[last]
+        self.count = last
+
+    def select(self, mask: np.ndarray) -> list[Actor]:
+        """Return the actors whose slots are set in a boolean mask."""
+        return [self._actors[slot] for slot in np.flatnonzero(mask).tolist()]
+
+    def radius_mask(
+        self,
+        x: int,
+        y: int,
+        radius: float,
+        metric: DistanceMetric = DistanceMetric.EUCLIDEAN,
+    ) -> np.ndarray:
+        """Return a mask of living actors within radius of a point."""
+        dx = self.x - x
+        dy = self.y - y
+        if metric is DistanceMetric.CHEBYSHEV:
+            within = np.maximum(np.abs(dx), np.abs(dy)) <= radius
+        else:
+            within = dx * dx + dy * dy <= radius * radius
+        return self.alive & within
+
+    def _append(self, actor: Actor) -> int:
+        """Give an actor the next free slot, growing the columns if needed."""
+        slot = self.count
+        capacity = len(self._columns['x'])
+        if slot == capacity:
+            for name, column in self._columns.items():
+                grown = np.zeros(capacity * 2, dtype=column.dtype)
+                grown[:capacity] = column
+                self._columns[name] = grown
+        self._actors.append(actor)
+        self._slots[actor] = slot
+        self.count += 1
+        return slot
+
+    def _write_ai(self, slot: int, actor: Actor) -> None:
+        ai = actor.ai
+        self._columns['alive'][slot] = ai is not None
+        self._columns['ai_kind'][slot] = self.ai_kind(type(ai) if ai is not None else None)
+
+    def _write_fighter(self, slot: int, actor: Actor) -> None:
+        fighter = actor.fighter
+        columns = self._columns
+        columns['hp'][slot] = fighter.hp
+        columns['max_hp'][slot] = fighter.max_hp
+        columns['power'][slot] = fighter.power
+        columns['defense'][slot] = fighter.defense
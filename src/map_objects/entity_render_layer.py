@@ -0,0 +1,149 @@
+"""Array-backed entity layer for drawing a map's entities in one pass."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from render_order import RenderOrder
+
+if TYPE_CHECKING:
+    from tcod.console import Console
+
+    from entity.base_entity import Entity
+    from game_types import ColorRGB
+
+    Appearance = tuple[str, ColorRGB, RenderOrder]
+
+# Row group of each render order, lowest order first so higher orders are drawn last.
+GROUPS = {render_order: group for group, render_order in enumerate(sorted(RenderOrder, key=lambda o: o.value))}
+
+INITIAL_CAPACITY = 64
+
+
+class EntityRenderLayer:
+    """Codepoint, color and position columns for entities, grouped by render order.
+
+    Rows form one contiguous run per render order, lowest first, so drawing in
+    row order puts higher orders on top without sorting. Moves and restyles
+    patch a row in place. Adding or removing an entity splices one row into or
+    out of its run, moving at most one row per later run.
+    """
+
+    def __init__(self) -> None:
+        self._appearances: dict[Entity, Appearance] = {}
+        self._slots: dict[Entity, int] = {}
+        self._rows: list[Entity | None] = [None] * INITIAL_CAPACITY
+        # Row just past the end of each group's run.
+        self._ends = [0] * len(GROUPS)
+        self._columns = {
+            'x': np.zeros(INITIAL_CAPACITY, dtype=np.intp),
+            'y': np.zeros(INITIAL_CAPACITY, dtype=np.intp),
+            'ch': np.zeros(INITIAL_CAPACITY, dtype=np.int32),
+            'fg': np.zeros((INITIAL_CAPACITY, 3), dtype=np.uint8),
+        }
+
+    @property
+    def count(self) -> int:
+        return self._ends[-1]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._columns['x'][:self.count]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._columns['y'][:self.count]
+
+    @property
+    def ch(self) -> np.ndarray:
+        return self._columns['ch'][:self.count]
+
+    @property
+    def fg(self) -> np.ndarray:
+        return self._columns['fg'][:self.count]
+
+    def remove(self, entity: Entity) -> None:
+        """Stop tracking an entity, closing the gap its row leaves in its run."""
+        appearance = self._appearances.pop(entity, None)
+        if appearance is None:
+            return
+        hole = self._slots.pop(entity)
+        ends = self._ends
+        # Fill the hole with the last row of its run, then pull each later run down by one row.
+        for group in range(GROUPS[appearance[2]], len(ends)):
+            last = ends[group] - 1
+            if last != hole:
+                self._move(last, hole)
+            hole = last
+            ends[group] = last
+        self._rows[hole] = None
+
+    def update(self, entity: Entity) -> None:
+        """Sync an entity's position, adding it or moving it to another run as needed."""
+        appearance = (entity.icon, entity.color, entity.render_order)
+        previous = self._appearances.get(entity)
+        if previous is not None and previous[2] is not appearance[2]:
+            self.remove(entity)
+            previous = None
+        if previous is None:
+            self._slots[entity] = self._insert(entity, GROUPS[entity.render_order])
+
+        columns = self._columns
+        slot = self._slots[entity]
+        columns['x'][slot] = entity.x
+        columns['y'][slot] = entity.y
+        if previous != appearance:
+            self._appearances[entity] = appearance
+            columns['ch'][slot] = ord(entity.icon)
+            columns['fg'][slot] = entity.color
+
+    def _insert(self, entity: Entity, group: int) -> int:
+        """Open a row at the end of a group's run for an entity and return it."""
+        if self.count == len(self._rows):
+            self._grow()
+        ends = self._ends
+        # Push each later run up by one row, moving its first row past its end.
+        for later in range(len(ends) - 1, group, -1):
+            start = ends[later - 1]
+            if start != ends[later]:
+                self._move(start, ends[later])
+            ends[later] += 1
+        slot = ends[group]
+        ends[group] += 1
+        self._rows[slot] = entity
+        return slot
+
+    def _move(self, source: int, target: int) -> None:
+        """Copy a row to another slot and point its entity at the new slot."""
+        for column in self._columns.values():
+            column[target] = column[source]
+        entity = self._rows[source]
+        self._rows[target] = entity
+        self._slots[entity] = target
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        capacity = len(self._rows)
+        for name, column in self._columns.items():
+            grown = np.zeros((capacity * 2, *column.shape[1:]), dtype=column.dtype)
+            grown[:capacity] = column
+            self._columns[name] = grown
+        self._rows.extend([None] * capacity)
+
+    def render(self, console: Console, visible: np.ndarray) -> None:
+        """Draw every entity standing on a visible tile."""
+        x, y = self.x, self.y
+        shown = np.flatnonzero(visible[x, y])
+        if not shown.size:
+            return
+
+        # Keep only the last (topmost) entity per tile so stacked entities draw in order.
+        tiles = np.ravel_multi_index((x[shown], y[shown]), visible.shape)
+        _, last_from_end = np.unique(tiles[::-1], return_index=True)
+        shown = shown[shown.size - 1 - last_from_end]
+
+        xs, ys = x[shown], y[shown]
+        console.tiles_rgb['ch'][xs, ys] = self.ch[shown]
+        console.tiles_rgb['fg'][xs, ys] = self.fg[shown]
@@ -2,23 +2,60 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import math
+import shutil
+import tempfile
+import weakref
+from collections.abc import Iterator, MutableSet
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from entity import Actor, Item
 from map_objects import tile_types
+from map_objects.actor_store import ActorStore, DistanceMetric
+from map_objects.entity_render_layer import EntityRenderLayer
 
 if TYPE_CHECKING:
     from tcod.console import Console
 
     from engine import Engine
     from entity.base_entity import Entity
+    from game_types import Position
+
+
+class EntitySet(MutableSet['Entity']):
+    """Mutable set view over a map's entities that keeps the position index in sync."""
+
+    def __init__(self, gamemap: GameMap) -> None:
+        self._gamemap = gamemap
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._gamemap._entity_positions
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self._gamemap._entity_positions)
+
+    def __len__(self) -> int:
+        return len(self._gamemap._entity_positions)
+
+    def add(self, entity: Entity) -> None:
+        self._gamemap.add_entity(entity)
+
+    def discard(self, entity: Entity) -> None:
+        self._gamemap.remove_entity(entity)
 
 
 class GameMap:
-    """Represents a single floor of the dungeon."""
+    """Represents a single floor of the dungeon.
+
+    With a storage_dir, the tiles, visible and explored layers are memory-mapped
+    .npy files instead of in-memory arrays, so the OS pages them in and out and
+    a huge floor does not have to fit in RAM. Each map gets its own fresh
+    subdirectory of storage_dir (layer_dir), removed once the map is discarded,
+    so any number of floors can share one storage_dir.
+    """
 
     def __init__(
         self,
@@ -26,15 +63,53 @@ class GameMap:
         width: int,
         height: int,
         entities: list[Entity],
+        storage_dir: Path | None = None,
     ) -> None:
         self.engine = engine
         self.width = width
         self.height = height
-        self.entities: set[Entity] = set(entities)
+        self.storage_dir = storage_dir
+        self.layer_dir = self._make_layer_dir(storage_dir)
         self.tiles = self._initialize_tiles()
+        # Bumped by mark_tiles_changed so callers can tell when derived state is stale.
+        self.tiles_version = 0
+
+        # Insertion-ordered entity -> indexed position, plus the reverse per-tile index.
+        self._entity_positions: dict[Entity, Position] = {}
+        self._entities_by_position: dict[Position, list[Entity]] = {}
+        # Bumped whenever an entity is added, moved or removed.
+        self._positions_version = 0
+        self.entities = EntitySet(self)
+        self._entity_layer = EntityRenderLayer()
+        self.actor_store = ActorStore()
+        # Actors added since the turn scheduler last looked.
+        self._arrivals: list[Actor] = []
+        self._items: dict[Item, None] = {}
+
+        # Pathfinding cost grid, built lazily and then patched as blockers change.
+        self._path_cost: np.ndarray | None = None
+        self._cost_contributions: dict[Entity, Position] = {}
+
+        for entity in entities:
+            self.add_entity(entity)
+
+        self.visible = self._new_layer('visible', np.bool_)
+        self.explored = self._new_layer('explored', np.bool_)
+
+        # Composed light/dark/FOW graphics, rebuilt only when tiles or visibility change.
+        self._tile_layer: np.ndarray | None = None
+        # Window last written by update_visible; None means anything may be visible.
+        self._visible_window: tuple[slice, slice] | None = None
+        # Bumped whenever visible changes.
+        self._visibility_version = 0
 
-        self.visible = np.full((width, height), fill_value=False, order='F')
-        self.explored = np.full((width, height), fill_value=False, order='F')
+        # Entities in view, rebuilt lazily once visibility or entity positions change.
+        self._visible_entities: list[Entity] = []
+        self._visible_entities_key: tuple[int, int] | None = None
+        # The view update_visible_entities last reported, and what changed since the one before.
+        self._reported_view: list[Entity] = []
+        self.entered_view: list[Entity] = []
+        self.left_view: list[Entity] = []
 
     @property
     def gamemap(self) -> GameMap:
@@ -43,12 +118,203 @@ class GameMap:
 
     def _initialize_tiles(self) -> np.ndarray:
         """Create initial tile array filled with walls."""
-        tiles = np.full(
-            (self.width, self.height),
-            fill_value=tile_types.wall,
-            order='F',
+        return self._new_layer('tiles', tile_types.tile_dt, tile_types.wall)
+
+    def _make_layer_dir(self, storage_dir: Path | None) -> Path | None:
+        """Create a directory for this map's layer files that no other map uses."""
+        if storage_dir is None:
+            return None
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        layer_dir = Path(tempfile.mkdtemp(prefix='floor-', dir=storage_dir))
+        weakref.finalize(self, shutil.rmtree, layer_dir, ignore_errors=True)
+        return layer_dir
+
+    def _new_layer(self, name: str, dtype: np.dtype | type, fill_value: object = None) -> np.ndarray:
+        """Return a width x height Fortran-order layer, zeroed unless a fill value is given.
+
+        The layer is memory-mapped to <layer_dir>/<name>.npy when the map has
+        a storage directory. A new mapped file is sparse, so zeroed layers cost
+        nothing until they are written.
+        """
+        shape = (self.width, self.height)
+        if self.layer_dir is None:
+            if fill_value is None:
+                return np.zeros(shape, dtype=dtype, order='F')
+            return np.full(shape, fill_value=fill_value, dtype=dtype, order='F')
+
+        layer = np.lib.format.open_memmap(
+            self.layer_dir / f'{name}.npy',
+            mode='w+',
+            dtype=dtype,
+            shape=shape,
+            fortran_order=True,
         )
-        return tiles
+        if fill_value is not None:
+            layer[...] = fill_value
+        return layer
+
+    def flush(self) -> None:
+        """Write memory-mapped layers back to their files. Does nothing for in-memory maps."""
+        for layer in (self.tiles, self.visible, self.explored):
+            if isinstance(layer, np.memmap):
+                layer.flush()
+
+    @property
+    def path_cost(self) -> np.ndarray:
+        """Return the pathfinding cost grid.
+
+        Walkable tiles cost 1 and each blocking entity on a walkable tile adds 10.
+        The grid is shared and kept current in place, so callers must not modify it.
+        """
+        if self._path_cost is None:
+            self._path_cost = np.array(self.tiles['walkable'], dtype=np.int8)
+            for entity in self.entities:
+                self._add_cost_contribution(entity)
+        return self._path_cost
+
+    def mark_tiles_changed(self) -> None:
+        """Invalidate state derived from tiles. Call after editing tiles in place."""
+        self._path_cost = None
+        self._cost_contributions.clear()
+        self._tile_layer = None
+        self.tiles_version += 1
+
+    def mark_visibility_changed(self) -> None:
+        """Invalidate state derived from visibility. Call after editing visible or explored."""
+        # The edit may reach outside the last FOV window.
+        self._visible_window = None
+        self._visibility_changed()
+
+    def _visibility_changed(self) -> None:
+        self._tile_layer = None
+        self._visibility_version += 1
+
+    def take_arrivals(self) -> list[Actor]:
+        """Return and forget the actors added to the map since the last call."""
+        arrivals, self._arrivals = self._arrivals, []
+        return arrivals
+
+    def update_visible(self, window: tuple[slice, slice], visible: np.ndarray) -> None:
+        """Make exactly the visible cells of a window visible and explored.
+
+        Only the previously written window is cleared, so the cost scales with
+        the window rather than the map.
+        """
+        if window == self._visible_window and np.array_equal(self.visible[window], visible):
+            return
+        if self._visible_window is None:
+            self.visible[:] = False
+        else:
+            self.visible[self._visible_window] = False
+        self.visible[window] = visible
+        self.explored[window] |= visible
+        self._visible_window = window
+        self._visibility_changed()
+
+    @property
+    def visible_entities(self) -> list[Entity]:
+        """Return the entities standing on visible tiles.
+
+        The list is shared and only rebuilt after visibility or an entity's
+        position changed, so callers must not modify it.
+        """
+        key = (self._visibility_version, self._positions_version)
+        if key != self._visible_entities_key:
+            self._visible_entities = self._find_visible_entities()
+            self._visible_entities_key = key
+        return self._visible_entities
+
+    def _find_visible_entities(self) -> list[Entity]:
+        """Collect the entities on visible tiles, looking only inside the last FOV window when possible."""
+        window = self._visible_window
+        if window is not None:
+            xs, ys = np.nonzero(self.visible[window])
+            if xs.size < len(self._entity_positions):
+                buckets = self._entities_by_position
+                cells = zip((xs + window[0].start).tolist(), (ys + window[1].start).tolist(), strict=True)
+                return [entity for cell in cells for entity in buckets.get(cell, ())]
+        visible = self.visible
+        return [entity for entity, position in self._entity_positions.items() if visible[position]]
+
+    def update_visible_entities(self) -> None:
+        """Record which entities entered or left view since the last call."""
+        previous = self._reported_view
+        current = self.visible_entities
+        if current is previous:
+            self.entered_view = []
+            self.left_view = []
+            return
+        previous_set = set(previous)
+        current_set = set(current)
+
+        self.entered_view = [entity for entity in current if entity not in previous_set]
+        self.left_view = [entity for entity in previous if entity not in current_set]
+        self._reported_view = current
+
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to the map, indexing it at its current position."""
+        self.update_entity(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from the map and the position index."""
+        position = self._entity_positions.pop(entity, None)
+        if position is not None:
+            self._unindex(entity, position)
+            self._positions_version += 1
+        self._entity_layer.remove(entity)
+        self._remove_cost_contribution(entity)
+        if isinstance(entity, Actor):
+            self.actor_store.remove(entity)
+        else:
+            self._items.pop(entity, None)
+
+    def update_entity(self, entity: Entity) -> None:
+        """Re-sync derived state after an entity moved, changed appearance or stopped blocking."""
+        position = (entity.x, entity.y)
+        old_position = self._entity_positions.get(entity)
+        if old_position != position:
+            if old_position is not None:
+                self._unindex(entity, old_position)
+            self._entity_positions[entity] = position
+            self._entities_by_position.setdefault(position, []).append(entity)
+            self._positions_version += 1
+        self._entity_layer.update(entity)
+        self._update_kind_index(entity)
+
+        if self._path_cost is None:
+            return
+        if self._cost_contributions.get(entity) != position or not entity.blocks_movement:
+            self._remove_cost_contribution(entity)
+            self._add_cost_contribution(entity)
+
+    def _update_kind_index(self, entity: Entity) -> None:
+        """Sync the actor store or item index for an entity."""
+        if isinstance(entity, Actor):
+            if entity not in self.actor_store:
+                self._arrivals.append(entity)
+            self.actor_store.update(entity)
+        elif isinstance(entity, Item):
+            self._items[entity] = None
+
+    def _unindex(self, entity: Entity, position: Position) -> None:
+        """Drop an entity from the bucket of the given tile."""
+        bucket = self._entities_by_position[position]
+        bucket.remove(entity)
+        if not bucket:
+            del self._entities_by_position[position]
+
+    def _add_cost_contribution(self, entity: Entity) -> None:
+        """Add a blocking entity's penalty to the cost grid."""
+        x, y = entity.x, entity.y
+        if entity.blocks_movement and self._path_cost[x, y]:
+            self._path_cost[x, y] += 10
+            self._cost_contributions[entity] = (x, y)
+
+    def _remove_cost_contribution(self, entity: Entity) -> None:
+        """Take back a penalty previously added for an entity."""
+        position = self._cost_contributions.pop(entity, None)
+        if position is not None:
+            self._path_cost[position] -= 10
 
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if the coordinates are within map bounds."""
@@ -56,15 +322,14 @@ class GameMap:
 
     def render(self, console: Console) -> None:
         """Render the map and entities to the console."""
-        console.tiles_rgb[0:self.width, 0:self.height] = np.select(
-            condlist=[self.visible, self.explored],
-            choicelist=[self.tiles['light'], self.tiles['dark']],
-            default=tile_types.FOW,
-        )
-
-        for entity in sorted(self.entities, key=lambda x: x.render_order.value):
-            if self.visible[entity.x, entity.y]:
-                console.print(x=entity.x, y=entity.y, string=entity.icon, fg=entity.color)
+        if self._tile_layer is None:
+            self._tile_layer = np.select(
+                condlist=[self.visible, self.explored],
+                choicelist=[self.tiles['light'], self.tiles['dark']],
+                default=tile_types.FOW,
+            )
+        console.tiles_rgb[0:self.width, 0:self.height] = self._tile_layer
+        self._entity_layer.render(console, self.visible)
 
     def get_entities_at(
         self,
@@ -73,35 +338,63 @@ class GameMap:
         entity_type: type[Entity] | None = None,
     ) -> Iterator[Entity]:
         """Yield all entities at the given position, optionally filtered by type."""
-        for entity in self.entities:
-            if entity.x == x and entity.y == y:
-                if entity_type is None or isinstance(entity, entity_type):
-                    yield entity
+        for entity in self._entities_by_position.get((x, y), ()):
+            if entity_type is None or isinstance(entity, entity_type):
+                yield entity
 
     def get_blocking_entity_at_location(self, x: int, y: int) -> Entity | None:
         """Return the blocking entity at the given location, if any."""
-        for entity in self.entities:
-            if entity.blocks_movement and entity.x == x and entity.y == y:
+        for entity in self._entities_by_position.get((x, y), ()):
+            if entity.blocks_movement:
                 return entity
         return None
 
     def get_actor_at_location(self, x: int, y: int) -> Actor | None:
         """Return the living actor at the given location, if any."""
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        for entity in self._entities_by_position.get((x, y), ()):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
         return None
 
     @property
     def actors(self) -> Iterator[Actor]:
         """Iterate over all living actors on the map."""
-        yield from (
-            entity
-            for entity in self.entities
-            if isinstance(entity, Actor) and entity.is_alive
-        )
+        yield from self.actor_store.select(self.actor_store.alive)
 
     @property
     def items(self) -> Iterator[Item]:
         """Iterate over all items on the map."""
-        yield from (entity for entity in self.entities if isinstance(entity, Item))
+        yield from list(self._items)
+
+    def get_actors_in_radius(
+        self,
+        x: int,
+        y: int,
+        radius: float,
+        metric: DistanceMetric = DistanceMetric.EUCLIDEAN,
+    ) -> list[Actor]:
+        """Return the living actors within radius of a point, inclusive."""
+        return self.actor_store.select(self.actor_store.radius_mask(x, y, radius, metric))
+
+    def get_nearest_visible_actor(
+        self,
+        x: int,
+        y: int,
+        max_distance: float = math.inf,
+        exclude: Actor | None = None,
+    ) -> Actor | None:
+        """Return the closest living actor in view strictly nearer than max_distance to a point.
+
+        Only the cached entities in view are considered. Ties go to the earlier one.
+        """
+        nearest = None
+        nearest_distance2 = max_distance * max_distance
+        for actor in self.get_visible_actors():
+            distance2 = (actor.x - x) ** 2 + (actor.y - y) ** 2
+            if distance2 < nearest_distance2 and actor is not exclude:
+                nearest, nearest_distance2 = actor, distance2
+        return nearest
+
+    def get_visible_actors(self) -> list[Actor]:
+        """Return the living actors standing on tiles in the player's field of view."""
+        return [entity for entity in self.visible_entities if isinstance(entity, Actor) and entity.is_alive]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -14,42 +13,45 @@ from map_objects import tile_types
 from map_objects.game_map import GameMap
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from random import Random
+
     from engine import Engine
-    from entity.base_entity import Entity
+    from entity_factories import EntityTemplate
     from game_types import Position
 
 
 @dataclass(frozen=True, slots=True)
 class SpawnEntry:
-    """An entry in a spawn table with a factory and weight."""
+    """An entry in a spawn table with a template and weight."""
 
-    factory: Entity
+    template: EntityTemplate
     weight: float
 
 
 MONSTER_SPAWN_TABLE: list[SpawnEntry] = [
-    SpawnEntry(entity_factories.orc, 0.8),
-    SpawnEntry(entity_factories.troll, 0.2),
+    SpawnEntry(entity_factories.ORC_TEMPLATE, 0.8),
+    SpawnEntry(entity_factories.TROLL_TEMPLATE, 0.2),
 ]
 
 ITEM_SPAWN_TABLE: list[SpawnEntry] = [
-    SpawnEntry(entity_factories.health_potion, 0.7),
-    SpawnEntry(entity_factories.fireball_scroll, 0.1),
-    SpawnEntry(entity_factories.confusion_scroll, 0.1),
-    SpawnEntry(entity_factories.lightning_scroll, 0.1),
+    SpawnEntry(entity_factories.HEALTH_POTION_TEMPLATE, 0.7),
+    SpawnEntry(entity_factories.FIREBALL_SCROLL_TEMPLATE, 0.1),
+    SpawnEntry(entity_factories.CONFUSION_SCROLL_TEMPLATE, 0.1),
+    SpawnEntry(entity_factories.LIGHTNING_SCROLL_TEMPLATE, 0.1),
 ]
 
 
-def weighted_choice(table: list[SpawnEntry]) -> Entity:
+def weighted_choice(table: list[SpawnEntry], rng: Random) -> EntityTemplate:
     """Select a random entry from a spawn table based on weights."""
     total = sum(entry.weight for entry in table)
-    roll = random.random() * total
+    roll = rng.random() * total
     cumulative = 0.0
     for entry in table:
         cumulative += entry.weight
         if roll < cumulative:
-            return entry.factory
-    return table[-1].factory
+            return entry.template
+    return table[-1].template
 
 
 @dataclass(slots=True)
@@ -97,12 +99,12 @@ class RectangularRoom:
         )
 
 
-def tunnel_between(start: Position, end: Position) -> Iterator[Position]:
+def tunnel_between(start: Position, end: Position, rng: Random) -> Iterator[Position]:
     """Generate an L-shaped tunnel between two points."""
     x1, y1 = start
     x2, y2 = end
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         corner_x, corner_y = x2, y1
     else:
         corner_x, corner_y = x1, y2
@@ -118,25 +120,26 @@ def place_entities(
     dungeon: GameMap,
     max_monsters: int,
     max_items: int,
+    rng: Random,
 ) -> None:
     """Place random monsters and items in a room."""
-    num_monsters = random.randint(0, max_monsters)
-    num_items = random.randint(0, max_items)
+    num_monsters = rng.randint(0, max_monsters)
+    num_items = rng.randint(0, max_items)
 
     for _ in range(num_monsters):
-        x = random.randint(room.x1 + 1, room.x2 - 1)
-        y = random.randint(room.y1 + 1, room.y2 - 1)
+        x = rng.randint(room.x1 + 1, room.x2 - 1)
+        y = rng.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(e.x == x and e.y == y for e in dungeon.entities):
-            monster = weighted_choice(MONSTER_SPAWN_TABLE)
+        if not any(dungeon.get_entities_at(x, y)):
+            monster = weighted_choice(MONSTER_SPAWN_TABLE, rng)
             monster.spawn(dungeon, x, y)
 
     for _ in range(num_items):
-        x = random.randint(room.x1 + 1, room.x2 - 1)
-        y = random.randint(room.y1 + 1, room.y2 - 1)
+        x = rng.randint(room.x1 + 1, room.x2 - 1)
+        y = rng.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(e.x == x and e.y == y for e in dungeon.entities):
-            item = weighted_choice(ITEM_SPAWN_TABLE)
+        if not any(dungeon.get_entities_at(x, y)):
+            item = weighted_choice(ITEM_SPAWN_TABLE, rng)
             item.spawn(dungeon, x, y)
 
 
@@ -149,18 +152,23 @@ def generate_dungeon(
     max_monsters_per_room: int,
     max_items_per_room: int,
     engine: Engine,
+    storage_dir: Path | None = None,
 ) -> GameMap:
-    """Generate a new dungeon map."""
+    """Generate a new dungeon map using the engine's random number generator.
+
+    The map's layers are memory-mapped under storage_dir when one is given.
+    """
     player = engine.player
-    dungeon = GameMap(engine, map_width, map_height, entities=[player])
+    rng = engine.rng
+    dungeon = GameMap(engine, map_width, map_height, entities=[player], storage_dir=storage_dir)
     rooms: list[RectangularRoom] = []
 
     for _ in range(max_rooms):
-        room_width = random.randint(room_min_size, room_max_size)
-        room_height = random.randint(room_min_size, room_max_size)
+        room_width = rng.randint(room_min_size, room_max_size)
+        room_height = rng.randint(room_min_size, room_max_size)
 
-        x = random.randint(0, dungeon.width - room_width - 1)
-        y = random.randint(0, dungeon.height - room_height - 1)
+        x = rng.randint(0, dungeon.width - room_width - 1)
+        y = rng.randint(0, dungeon.height - room_height - 1)
 
         new_room = RectangularRoom(x, y, room_width, room_height)
 
@@ -172,10 +180,10 @@ def generate_dungeon(
         if len(rooms) == 0:
             player.place(*new_room.center, dungeon)
         else:
-            for tunnel_x, tunnel_y in tunnel_between(rooms[-1].center, new_room.center):
+            for tunnel_x, tunnel_y in tunnel_between(rooms[-1].center, new_room.center, rng):
                 dungeon.tiles[tunnel_x, tunnel_y] = tile_types.floor
 
-        place_entities(new_room, dungeon, max_monsters_per_room, max_items_per_room)
+        place_entities(new_room, dungeon, max_monsters_per_room, max_items_per_room, rng)
         rooms.append(new_room)
 
     return dungeon
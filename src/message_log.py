@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import struct
 import textwrap
-from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Iterable, Iterator, Reversible
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, BinaryIO
 
 import color as color_module
+from render_functions import CachedPanel
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from tcod.console import Console
 
     from game_types import ColorRGB
 
+DEFAULT_CAPACITY = 1000
+
+# Journal record header: stack count, fg red/green/blue, UTF-8 text length.
+JOURNAL_RECORD = struct.Struct('<I3BI')
+
 
 @dataclass(slots=True)
 class Message:
@@ -22,6 +33,8 @@ class Message:
     plain_text: str
     fg: ColorRGB
     count: int = 1
+    # (width, count) the lines were wrapped for, and the lines themselves.
+    _wrapped: tuple[int, int, tuple[str, ...]] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
@@ -30,12 +43,31 @@ class Message:
             return f'{self.plain_text} (x{self.count})'
         return self.plain_text
 
+    def wrapped(self, width: int) -> tuple[str, ...]:
+        """Return the full text wrapped to width, reusing the last result while width and count match."""
+        cached = self._wrapped
+        if cached is None or cached[0] != width or cached[1] != self.count:
+            cached = self._wrapped = (width, self.count, tuple(MessageLog.wrap(self.full_text, width)))
+        return cached[2]
 
-class MessageLog:
-    """A log of game messages with rendering capabilities."""
 
-    def __init__(self) -> None:
-        self.messages: list[Message] = []
+class MessageLog:
+    """A log of game messages with rendering capabilities.
+
+    Only the newest `capacity` messages are kept. When a journal path is given,
+    messages pushed out of the log are appended to it instead of being lost.
+    `version` changes whenever the log's contents do, so panels showing the log
+    only need redrawing when it moves.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, journal_path: Path | None = None) -> None:
+        if capacity < 1:
+            raise ValueError(f'Message log capacity must be at least 1, not {capacity}.')
+        self.messages: deque[Message] = deque(maxlen=capacity)
+        self.journal_path = journal_path
+        self.version = 0
+        self._journal: BinaryIO | None = None
+        self._panel = CachedPanel()
 
     def add_message(
         self,
@@ -51,14 +83,56 @@ class MessageLog:
             fg: Text color
             stack: If True, stack with previous identical messages
         """
-        if stack and self.messages and text == self.messages[-1].plain_text:
-            self.messages[-1].count += 1
-        else:
-            self.messages.append(Message(text, fg))
+        self.version += 1
+        messages = self.messages
+        if stack and messages and text == messages[-1].plain_text:
+            messages[-1].count += 1
+            return
+        if len(messages) == messages.maxlen and self.journal_path is not None:
+            self._spill(messages[0])
+        messages.append(Message(text, fg))
+
+    def clear(self) -> None:
+        """Remove every message from the log."""
+        self.messages.clear()
+        self.version += 1
+
+    def newest_first(self, stop: int | None = None) -> Iterator[Message]:
+        """Yield messages before index stop (default: all of them), newest first, without copying."""
+        skip = 0 if stop is None else max(0, len(self.messages) - stop)
+        return islice(reversed(self.messages), skip, None)
+
+    def flush(self) -> None:
+        """Push spilled messages still buffered in memory out to the journal file."""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal file, if one is open."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _spill(self, message: Message) -> None:
+        """Append a message that is about to leave the log to the journal."""
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+        text = message.plain_text.encode()
+        self._journal.write(JOURNAL_RECORD.pack(message.count, *message.fg, len(text)) + text)
 
     def render(self, console: Console, x: int, y: int, width: int, height: int) -> None:
-        """Render the message log to the console."""
-        self.render_messages(console, x, y, width, height, self.messages)
+        """Blit the message panel to the console, redrawing it first if the log changed."""
+        panel = self._panel.draw(
+            width,
+            height,
+            self.version,
+            lambda panel: self.render_newest_first(panel, 0, 0, width, height, reversed(self.messages)),
+        )
+        panel.blit(console, x, y)
+
+    def render_history(self, console: Console, x: int, y: int, width: int, height: int, stop: int) -> None:
+        """Render the log as it stood up to (not including) index stop."""
+        self.render_newest_first(console, x, y, width, height, self.newest_first(stop))
 
     @staticmethod
     def wrap(string: str, width: int) -> Iterator[str]:
@@ -74,13 +148,34 @@ class MessageLog:
         y: int,
         width: int,
         height: int,
-        messages: list[Message],
+        messages: Reversible[Message],
+    ) -> None:
+        """Render a sequence of messages, oldest first, to the console."""
+        cls.render_newest_first(console, x, y, width, height, reversed(messages))
+
+    @classmethod
+    def render_newest_first(
+        cls,
+        console: Console,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        messages: Iterable[Message],
     ) -> None:
-        """Render a list of messages to the console."""
+        """Render messages bottom-up, stopping once the panel is full."""
         y_offset = height - 1
-        for message in reversed(messages):
-            for line in reversed(list(cls.wrap(message.full_text, width))):
+        for message in messages:
+            for line in reversed(message.wrapped(width)):
                 console.print(x=x, y=y + y_offset, string=line, fg=message.fg)
                 y_offset -= 1
                 if y_offset < 0:
                     return
+
+
+def read_journal(path: Path) -> Iterator[Message]:
+    """Yield the messages spilled to a journal file, oldest first."""
+    with open(path, 'rb') as journal:
+        while header := journal.read(JOURNAL_RECORD.size):
+            count, red, green, blue, length = JOURNAL_RECORD.unpack(header)
+            yield Message(journal.read(length).decode(), (red, green, blue), count)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from typing import TYPE_CHECKING
 
+import tcod.console
+
 import color
 
 if TYPE_CHECKING:
@@ -13,6 +16,53 @@ if TYPE_CHECKING:
     from map_objects.game_map import GameMap
 
 
+class CachedPanel:
+    """An off-screen console that is only redrawn when its key changes.
+
+    Callers pass a key describing everything the panel shows (a version
+    counter, a cursor, ...) and blit the returned console every frame. A key
+    of None always redraws.
+    """
+
+    __slots__ = ('console', 'key')
+
+    def __init__(self) -> None:
+        self.console: Console | None = None
+        self.key: Hashable = None
+
+    def draw(self, width: int, height: int, key: Hashable, draw: Callable[[Console], None]) -> Console:
+        """Return the panel console, calling draw on a cleared console first if it is stale."""
+        console = self.console
+        if console is None or console.width != width or console.height != height:
+            console = self.console = tcod.console.Console(width, height, order='F')
+            self.key = None
+        if key is None or key != self.key:
+            console.clear()
+            draw(console)
+            self.key = key
+        return console
+
+
+class PanelPool:
+    """Named CachedPanels shared across handler instances.
+
+    Only one handler is active at a time, and each panel's key fully describes
+    what it shows, so reopening a menu can reuse the console (and often the
+    drawing) left behind by the previous instance.
+    """
+
+    __slots__ = ('_panels',)
+
+    def __init__(self) -> None:
+        self._panels: dict[str, CachedPanel] = {}
+
+    def __getitem__(self, name: str) -> CachedPanel:
+        panel = self._panels.get(name)
+        if panel is None:
+            panel = self._panels[name] = CachedPanel()
+        return panel
+
+
 def render_bar(
     console: Console,
     current_value: int,
@@ -37,7 +87,7 @@ def get_names_at_location(x: int, y: int, game_map: GameMap) -> str:
     if not game_map.in_bounds(x, y) or not game_map.visible[x, y]:
         return ''
 
-    names = ', '.join(entity.name for entity in game_map.entities if entity.x == x and entity.y == y)
+    names = ', '.join(entity.name for entity in game_map.get_entities_at(x, y))
     return names.capitalize()
 
 
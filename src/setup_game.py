@@ -0,0 +1,34 @@
+"""New game setup shared by the windowed and headless entry points."""
+
+from __future__ import annotations
+
+import color
+import entity_factories
+from config import DEFAULT_CONFIG, GameConfig
+from engine import Engine
+from map_objects.procgen import generate_dungeon
+
+
+def new_game(config: GameConfig = DEFAULT_CONFIG) -> Engine:
+    """Create an engine with a freshly generated dungeon and the player placed in it."""
+    player = entity_factories.PLAYER_TEMPLATE.create()
+    engine = Engine(player=player, config=config)
+
+    engine.game_map = generate_dungeon(
+        max_rooms=config.max_rooms,
+        room_min_size=config.room_min_size,
+        room_max_size=config.room_max_size,
+        map_width=config.map_width,
+        map_height=config.map_height,
+        max_monsters_per_room=config.max_monsters_per_room,
+        max_items_per_room=config.max_items_per_room,
+        engine=engine,
+        storage_dir=config.map_storage_dir,
+    )
+
+    engine.update_fov()
+    engine.message_log.add_message(
+        'Welcome to the next iteration of Super Dungeon Slaughter!',
+        color.welcome_text,
+    )
+    return engine
@@ -0,0 +1,427 @@
+"""Compact binary snapshots of a game in progress, for saving and loading.
+
+A snapshot is a fixed header (magic bytes and format version) followed by:
+
+- a table of the distinct strings (names, icons) that later records index into;
+- the map size, its tiles as a palette of distinct tile values plus one index
+  per cell, and the visible/explored layers as packed bits;
+- the engine's RNG state;
+- every entity on the map as a tagged record, with the player's index;
+- the turn scheduler's clock, queue and dormant set;
+- the message log.
+
+Arrays are written as raw NumPy buffers in Fortran order, so reading a
+snapshot back is mostly `np.frombuffer` rather than rebuilding objects.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import struct
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import exceptions
+from components.ai import BaseAI, ConfusedEnemy, HostileEnemy
+from components.confusion_consumable import ConfusionConsumable
+from components.fighter import Fighter
+from components.fireball_damage_consumable import FireballDamageConsumable
+from components.healing_consumable import HealingConsumable
+from components.inventory import Inventory
+from components.lightning_damage_consumable import LightningDamageConsumable
+from config import DEFAULT_CONFIG
+from engine import Engine
+from entity import Actor, Item
+from map_objects import tile_types
+from map_objects.game_map import GameMap
+from message_log import JOURNAL_RECORD, Message
+from render_order import RenderOrder
+from turn_scheduler import TurnScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from components.consumable import Consumable
+    from config import GameConfig
+    from entity.base_entity import Entity
+    from message_log import MessageLog
+
+MAGIC = b'YARSAVE\x00'
+VERSION = 2
+
+HEADER = struct.Struct('<8sH')
+# tag, x, y, color, blocks_movement, render_order, icon and name string indices
+ENTITY_COMMON = struct.Struct('<Bii3B?BII')
+ACTOR_STATS = struct.Struct('<iiiiii')  # speed, max_hp, hp, defense, power, inventory capacity
+
+TAG_ACTOR = 1
+TAG_ITEM = 2
+
+# AI class -> tag. Zero means no AI (a corpse).
+AI_TAGS: dict[type[BaseAI] | None, int] = {None: 0, BaseAI: 1, HostileEnemy: 2, ConfusedEnemy: 3}
+AI_CLASSES = {tag: ai_cls for ai_cls, tag in AI_TAGS.items()}
+
+# Consumable classes, tagged by position, with the constructor arguments saved for each.
+# Append only: reordering or changing fields needs a VERSION bump.
+CONSUMABLES: tuple[tuple[type[Consumable], tuple[str, ...]], ...] = (
+    (HealingConsumable, ('amount',)),
+    (LightningDamageConsumable, ('damage', 'maximum_range')),
+    (ConfusionConsumable, ('number_of_turns',)),
+    (FireballDamageConsumable, ('damage', 'radius')),
+)
+CONSUMABLE_TAGS = {consumable_cls: tag for tag, (consumable_cls, _) in enumerate(CONSUMABLES)}
+
+BOOL_LAYERS = ('visible', 'explored')
+
+
+class _Writer:
+    """Accumulates snapshot bytes, with repeated strings collected into one table."""
+
+    __slots__ = ('parts', 'strings')
+
+    def __init__(self) -> None:
+        self.parts: list[bytes] = []
+        self.strings: dict[str, int] = {}
+
+    def pack(self, fmt: str | struct.Struct, *values: object) -> None:
+        if isinstance(fmt, struct.Struct):
+            self.parts.append(fmt.pack(*values))
+        else:
+            self.parts.append(struct.pack(fmt, *values))
+
+    def intern(self, text: str) -> int:
+        """Return the string table index for text, adding it if it is new."""
+        return self.strings.setdefault(text, len(self.strings))
+
+    def string_table(self) -> bytes:
+        """Return the string count, each string's UTF-8 length, then the strings back to back."""
+        encoded = [text.encode() for text in self.strings]
+        lengths = np.fromiter(map(len, encoded), dtype='<u4', count=len(encoded))
+        return struct.pack('<I', len(encoded)) + lengths.tobytes() + b''.join(encoded)
+
+    def array(self, array: np.ndarray) -> None:
+        """Write an array's raw bytes; the reader supplies the dtype and shape."""
+        data = array.tobytes(order='F')
+        self.parts.append(struct.pack('<Q', len(data)) + data)
+
+
+class _Reader:
+    """Walks snapshot bytes written by _Writer."""
+
+    __slots__ = ('data', 'offset', 'strings')
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+        self.strings: list[str] = []
+
+    def unpack(self, fmt: str | struct.Struct) -> tuple:
+        if isinstance(fmt, struct.Struct):
+            values = fmt.unpack_from(self.data, self.offset)
+            self.offset += fmt.size
+        else:
+            values = struct.unpack_from(fmt, self.data, self.offset)
+            self.offset += struct.calcsize(fmt)
+        return values
+
+    def take(self, length: int) -> memoryview:
+        chunk = self.data[self.offset:self.offset + length]
+        if len(chunk) != length:
+            raise struct.error('snapshot is truncated')
+        self.offset += length
+        return chunk
+
+    def read_string_table(self) -> None:
+        (count,) = self.unpack('<I')
+        ends = np.cumsum(np.frombuffer(self.take(count * 4), dtype='<u4'), dtype=np.int64).tolist()
+        data = bytes(self.take(ends[-1] if ends else 0))
+        self.strings = [data[start:end].decode() for start, end in zip([0, *ends], ends, strict=False)]
+
+    def array(self, dtype: np.dtype | type, shape: tuple[int, ...]) -> np.ndarray:
+        """Return a read-only array over the next buffer in the snapshot."""
+        (length,) = self.unpack('<Q')
+        return np.frombuffer(self.take(length), dtype=dtype).reshape(shape, order='F')
+
+
+def save(engine: Engine, path: Path) -> None:
+    """Write a snapshot of the engine to path, replacing any previous save atomically."""
+    engine.game_map.flush()
+    engine.message_log.flush()
+    temporary = path.with_name(path.name + '.tmp')
+    temporary.write_bytes(encode(engine))
+    os.replace(temporary, path)
+
+
+def load(path: Path, config: GameConfig = DEFAULT_CONFIG) -> Engine:
+    """Read a snapshot written by save and rebuild the engine from it."""
+    return decode(path.read_bytes(), config)
+
+
+def encode(engine: Engine) -> bytes:
+    """Return a snapshot of the engine's current floor, entities, clock and messages."""
+    game_map = engine.game_map
+    entities = list(game_map.entities)
+    indices = {entity: index for index, entity in enumerate(entities)}
+    if engine.player not in indices:
+        raise ValueError('Cannot save a game whose player is not on the map.')
+
+    out = _Writer()
+    _write_map(out, game_map)
+    _write_rng(out, engine.rng)
+    out.pack('<II', len(entities), indices[engine.player])
+    for entity in entities:
+        _write_entity(out, entity)
+    _write_scheduler(out, engine.scheduler, indices)
+    _write_messages(out, engine.message_log.messages)
+    return b''.join([HEADER.pack(MAGIC, VERSION), out.string_table(), *out.parts])
+
+
+def decode(data: bytes, config: GameConfig = DEFAULT_CONFIG) -> Engine:
+    """Rebuild an engine from a snapshot returned by encode."""
+    try:
+        return _read_engine(_Reader(data), config)
+    except (struct.error, KeyError, IndexError, ValueError) as exc:
+        raise exceptions.InvalidSaveError('The save file is damaged.') from exc
+
+
+def _read_engine(inp: _Reader, config: GameConfig) -> Engine:
+    magic, version = inp.unpack(HEADER)
+    if magic != MAGIC:
+        raise exceptions.InvalidSaveError('Not a save file.')
+    if version != VERSION:
+        raise exceptions.InvalidSaveError(f'Unsupported save version {version}.')
+
+    inp.read_string_table()
+    width, height, tiles, visible, explored = _read_map(inp)
+    rng_state = _read_rng(inp)
+    count, player_index = inp.unpack('<II')
+    entities = [_read_entity(inp) for _ in range(count)]
+    player = entities[player_index]
+    if not isinstance(player, Actor):
+        raise exceptions.InvalidSaveError('The saved player is not an actor.')
+
+    engine = Engine(player=player, config=config)
+    engine.rng.setstate(rng_state)
+    game_map = GameMap(engine, width, height, entities=[], storage_dir=config.map_storage_dir)
+    # Copy into the map's own layers, which may be memory-mapped.
+    game_map.tiles[...] = tiles
+    game_map.visible[...] = visible
+    game_map.explored[...] = explored
+    for entity in entities:
+        entity.parent = game_map
+        game_map.add_entity(entity)
+    engine.game_map = game_map
+    engine.scheduler = _read_scheduler(inp, entities, game_map, player)
+    _read_messages(inp, engine.message_log)
+    engine.update_fov()
+    return engine
+
+
+def _write_map(out: _Writer, game_map: GameMap) -> None:
+    out.pack('<II', game_map.width, game_map.height)
+    palette, indices = _tile_palette(game_map.tiles)
+    out.pack('<B', indices.itemsize)
+    out.array(palette)
+    out.array(indices)
+    for name in BOOL_LAYERS:
+        out.array(np.packbits(getattr(game_map, name).ravel(order='F')))
+
+
+def _read_map(inp: _Reader) -> tuple[int, int, np.ndarray, np.ndarray, np.ndarray]:
+    width, height = inp.unpack('<II')
+    (index_size,) = inp.unpack('<B')
+    palette = inp.array(tile_types.tile_dt, (-1,))
+    indices = inp.array(np.dtype(f'<u{index_size}'), (-1,))
+    tiles = palette[indices].reshape(width, height, order='F')
+    visible, explored = (
+        np.unpackbits(inp.array(np.uint8, (-1,)), count=width * height).view(np.bool_).reshape(width, height, order='F')
+        for _ in BOOL_LAYERS
+    )
+    return width, height, tiles, visible, explored
+
+
+def _tile_palette(tiles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split tiles into their distinct values and a per-cell index into them.
+
+    Maps use a handful of tile types, so one vectorized comparison per type
+    is much cheaper than sorting every cell to find the distinct values.
+    """
+    cells = tiles.ravel(order='F')
+    keys = cells.view(f'V{cells.dtype.itemsize}')
+    indices = np.zeros(keys.size, dtype=np.uint16)
+    unassigned = np.ones(keys.size, dtype=np.bool_)
+    firsts: list[int] = []
+    while unassigned.any():
+        first = int(np.argmax(unassigned))
+        matches = keys == keys[first]
+        indices[matches] = len(firsts)
+        unassigned &= ~matches
+        firsts.append(first)
+    if len(firsts) <= 256:
+        indices = indices.astype(np.uint8)
+    return cells[firsts], indices.reshape(tiles.shape, order='F')
+
+
+def _write_rng(out: _Writer, rng: random.Random) -> None:
+    version, internal, gauss_next = rng.getstate()
+    out.pack('<I', version)
+    out.array(np.array(internal, dtype=np.uint32))
+    out.pack('<?d', gauss_next is not None, gauss_next or 0.0)
+
+
+def _read_rng(inp: _Reader) -> tuple:
+    (version,) = inp.unpack('<I')
+    internal = tuple(inp.array(np.uint32, (-1,)).tolist())
+    has_gauss, gauss_next = inp.unpack('<?d')
+    return version, internal, gauss_next if has_gauss else None
+
+
+def _write_entity(out: _Writer, entity: Entity) -> None:
+    if isinstance(entity, Actor):
+        tag = TAG_ACTOR
+    elif isinstance(entity, Item):
+        tag = TAG_ITEM
+    else:
+        raise TypeError(f'Cannot save {type(entity).__name__} entities.')
+    out.pack(
+        ENTITY_COMMON,
+        tag,
+        entity.x,
+        entity.y,
+        *entity.color,
+        entity.blocks_movement,
+        entity.render_order.value,
+        out.intern(entity.icon),
+        out.intern(entity.name),
+    )
+    if tag == TAG_ACTOR:
+        _write_actor(out, entity)
+    else:
+        _write_consumable(out, entity.consumable)
+
+
+def _read_entity(inp: _Reader) -> Entity:
+    tag, x, y, red, green, blue, blocks_movement, render_order, icon, name = inp.unpack(ENTITY_COMMON)
+    strings = inp.strings
+    fields = {'x': x, 'y': y, 'icon': strings[icon], 'color': (red, green, blue), 'name': strings[name]}
+    if tag == TAG_ACTOR:
+        entity = _read_actor(inp, fields)
+    elif tag == TAG_ITEM:
+        entity = Item(**fields, consumable=_read_consumable(inp))
+    else:
+        raise exceptions.InvalidSaveError(f'Unknown entity tag {tag}.')
+    # Corpses keep their actor class but neither block nor draw as actors.
+    entity.blocks_movement = blocks_movement
+    entity.render_order = RenderOrder(render_order)
+    return entity
+
+
+def _write_actor(out: _Writer, actor: Actor) -> None:
+    fighter = actor.fighter
+    inventory = actor.inventory
+    out.pack(ACTOR_STATS, actor.speed, fighter.max_hp, fighter.hp, fighter.defense, fighter.power, inventory.capacity)
+    _write_ai(out, actor.ai)
+    out.pack('<I', len(inventory.items))
+    for item in inventory.items:
+        _write_entity(out, item)
+
+
+def _read_actor(inp: _Reader, fields: dict) -> Actor:
+    speed, max_hp, hp, defense, power, capacity = inp.unpack(ACTOR_STATS)
+    actor = Actor(
+        **fields,
+        ai_cls=BaseAI,
+        fighter=Fighter(hp=max_hp, defense=defense, power=power),
+        inventory=Inventory(capacity),
+        speed=speed,
+    )
+    # Restore the AI before the hit points, so a corpse at 0 HP does not die again.
+    actor.ai = _read_ai(inp, actor)
+    actor.fighter.hp = hp
+    (count,) = inp.unpack('<I')
+    for _ in range(count):
+        item = _read_entity(inp)
+        item.parent = actor.inventory
+        actor.inventory.items.append(item)
+    return actor
+
+
+def _write_ai(out: _Writer, ai: BaseAI | None) -> None:
+    ai_cls = type(ai) if ai is not None else None
+    if ai_cls not in AI_TAGS:
+        raise TypeError(f'Cannot save {ai_cls.__name__} AI.')
+    out.pack('<B', AI_TAGS[ai_cls])
+    if isinstance(ai, HostileEnemy):
+        out.array(np.array(ai.path or (), dtype=np.int32).reshape(-1, 2))
+    elif isinstance(ai, ConfusedEnemy):
+        out.pack('<i', ai.turns_remaining)
+        _write_ai(out, ai.previous_ai)
+
+
+def _read_ai(inp: _Reader, actor: Actor) -> BaseAI | None:
+    (tag,) = inp.unpack('<B')
+    ai_cls = AI_CLASSES[tag]
+    if ai_cls is None:
+        return None
+    if ai_cls is HostileEnemy:
+        ai = HostileEnemy(actor)
+        ai.set_path(tuple(step) for step in inp.array(np.int32, (-1, 2)).tolist())
+        return ai
+    if ai_cls is ConfusedEnemy:
+        (turns_remaining,) = inp.unpack('<i')
+        return ConfusedEnemy(actor, _read_ai(inp, actor), turns_remaining)
+    return ai_cls(actor)
+
+
+def _write_consumable(out: _Writer, consumable: Consumable) -> None:
+    tag = CONSUMABLE_TAGS.get(type(consumable))
+    if tag is None:
+        raise TypeError(f'Cannot save {type(consumable).__name__} items.')
+    _, fields = CONSUMABLES[tag]
+    out.pack(f'<B{len(fields)}i', tag, *(getattr(consumable, field) for field in fields))
+
+
+def _read_consumable(inp: _Reader) -> Consumable:
+    (tag,) = inp.unpack('<B')
+    consumable_cls, fields = CONSUMABLES[tag]
+    return consumable_cls(*inp.unpack(f'<{len(fields)}i'))
+
+
+def _write_scheduler(out: _Writer, scheduler: TurnScheduler, indices: dict[Entity, int]) -> None:
+    queued = [(indices[actor], time) for actor, time in scheduler.queued() if actor in indices]
+    dormant = [indices[actor] for actor in scheduler.dormant if actor in indices]
+    out.pack('<q', scheduler.time)
+    out.array(np.array(queued, dtype=np.int64).reshape(-1, 2))
+    out.array(np.array(dormant, dtype=np.uint32))
+
+
+def _read_scheduler(inp: _Reader, entities: list[Entity], game_map: GameMap, player: Actor) -> TurnScheduler:
+    scheduler = TurnScheduler()
+    (scheduler.time,) = inp.unpack('<q')
+    for index, time in inp.array(np.int64, (-1, 2)).tolist():
+        scheduler.schedule(entities[index], time)
+    for index in inp.array(np.uint32, (-1,)).tolist():
+        scheduler.park(entities[index])
+    # Monsters that arrived after the last enemy turn were saved unscheduled; they act next.
+    for actor in game_map.actors:
+        if actor is not player and actor not in scheduler and actor not in scheduler.dormant:
+            scheduler.schedule(actor)
+    return scheduler
+
+
+def _write_messages(out: _Writer, messages: Iterable[Message]) -> None:
+    messages = list(messages)
+    out.pack('<I', len(messages))
+    for message in messages:
+        text = message.plain_text.encode()
+        out.parts.append(JOURNAL_RECORD.pack(message.count, *message.fg, len(text)) + text)
+
+
+def _read_messages(inp: _Reader, message_log: MessageLog) -> None:
+    (count,) = inp.unpack('<I')
+    for _ in range(count):
+        message_count, red, green, blue, length = inp.unpack(JOURNAL_RECORD)
+        message_log.messages.append(Message(bytes(inp.take(length)).decode(), (red, green, blue), message_count))
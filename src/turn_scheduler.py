@@ -0,0 +1,84 @@
+"""Heap-based turn scheduler on a shared game clock."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from entity.actor import Actor
+
+NORMAL_SPEED = 100
+TURN_LENGTH = 100  # Clock ticks one action takes at normal speed
+
+
+def action_delay(speed: int) -> int:
+    """Return the clock ticks between two actions at the given speed."""
+    return max(1, TURN_LENGTH * NORMAL_SPEED // max(1, speed))
+
+
+class TurnScheduler:
+    """Orders actor turns by next action time, then by scheduling order.
+
+    Each actor has at most one live entry. Rescheduling or unscheduling an actor
+    leaves its old heap entry behind as stale; stale entries are skipped when
+    they reach the top instead of being searched for and removed.
+
+    Parked actors are dormant: they are off the heap entirely and cost nothing
+    per turn until woken.
+    """
+
+    def __init__(self, actors: Iterable[Actor] = ()) -> None:
+        self.time = 0
+        self._heap: list[tuple[int, int, Actor]] = []
+        self._entries: dict[Actor, int] = {}
+        self.dormant: dict[Actor, None] = {}
+        self._sequence = itertools.count()
+        for actor in actors:
+            self.schedule(actor)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, actor: object) -> bool:
+        return actor in self._entries
+
+    def schedule(self, actor: Actor, time: int | None = None) -> None:
+        """Schedule an actor's next action, replacing any earlier entry. Defaults to now."""
+        self.dormant.pop(actor, None)
+        sequence = next(self._sequence)
+        self._entries[actor] = sequence
+        heapq.heappush(self._heap, (self.time if time is None else time, sequence, actor))
+
+    def unschedule(self, actor: Actor) -> None:
+        """Drop an actor from the schedule."""
+        self._entries.pop(actor, None)
+        self.dormant.pop(actor, None)
+
+    def park(self, actor: Actor) -> None:
+        """Take an actor off the schedule until it is woken."""
+        self._entries.pop(actor, None)
+        self.dormant[actor] = None
+
+    def wake(self, actor: Actor) -> None:
+        """Schedule a dormant actor to act now. Does nothing for actors that are not dormant."""
+        if actor in self.dormant:
+            self.schedule(actor)
+
+    def queued(self) -> list[tuple[Actor, int]]:
+        """Return the scheduled actors with their action times, in the order they will act."""
+        entries = self._entries
+        live = sorted(entry for entry in self._heap if entries.get(entry[2]) == entry[1])
+        return [(actor, time) for time, _, actor in live]
+
+    def pop_due(self, end_time: int) -> tuple[Actor, int] | None:
+        """Remove and return the next actor due before end_time, with its action time."""
+        heap = self._heap
+        while heap and heap[0][0] < end_time:
+            time, sequence, actor = heapq.heappop(heap)
+            if self._entries.get(actor) == sequence:
+                del self._entries[actor]
+                return actor, time
+        return None
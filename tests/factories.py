@@ -406,6 +406,7 @@ class GameFactory:
         if fill_with_floor:
             # Fill with floor tiles for easy testing
             game_map.tiles[:] = tile_types.floor
+            game_map.mark_tiles_changed()
         return game_map
 
     @staticmethod
@@ -438,6 +439,7 @@ class GameFactory:
         if wall_positions:
             for x, y in wall_positions:
                 game_map.tiles[x, y] = tile_types.wall
+            game_map.mark_tiles_changed()
         return game_map
 
 
@@ -478,4 +480,4 @@ class MessageLogHelper:
 
     def clear(self) -> None:
         """Clear all messages."""
-        self.message_log.messages.clear()
+        self.message_log.clear()
@@ -177,6 +177,7 @@ class GameTestCase(unittest.TestCase):
         """
         from map_objects import tile_types
         self.game_map.tiles[x, y] = tile_types.floor
+        self.game_map.mark_tiles_changed()
 
     def make_tile_wall(self, x: int, y: int) -> None:
         """Make a specific tile a wall.
@@ -187,6 +188,7 @@ class GameTestCase(unittest.TestCase):
         """
         from map_objects import tile_types
         self.game_map.tiles[x, y] = tile_types.wall
+        self.game_map.mark_tiles_changed()
 
     def set_visible(self, x: int, y: int, visible: bool = True) -> None:
         """Set visibility for a specific tile.
@@ -197,6 +199,7 @@ class GameTestCase(unittest.TestCase):
             visible: Whether the tile should be visible
         """
         self.game_map.visible[x, y] = visible
+        self.game_map.mark_visibility_changed()
 
     def make_area_visible(self, x1: int, y1: int, x2: int, y2: int) -> None:
         """Make a rectangular area visible.
@@ -208,6 +211,7 @@ class GameTestCase(unittest.TestCase):
             y2: Bottom bound (exclusive)
         """
         self.game_map.visible[x1:x2, y1:y2] = True
+        self.game_map.mark_visibility_changed()
 
     def assertMessageContains(self, text: str, msg: str | None = None) -> None:
         """Assert that any message contains the given text.
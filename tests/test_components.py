@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import sys
 import unittest
+from collections import deque
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -208,8 +209,9 @@ class TestHostileAI(GameTestCase):
 
     The hostile AI should:
     - Attack when adjacent to player
-    - Move toward player when visible
-    - Follow last known path when player not visible
+    - Move toward player when it can see them
+    - Follow last known path when it cannot
+    - Notice the player by its own line of sight, not the player's FOV
     """
 
     def test_hostile_ai_attacks_when_adjacent(self):
@@ -235,19 +237,142 @@ class TestHostileAI(GameTestCase):
         # Orc should have moved closer
         self.assertLess(orc.x, initial_x)
 
+    def test_hostile_ai_routes_around_walls(self):
+        """Hostile AI steps around a wall instead of into it."""
+        orc = self.place_orc(self.player.x + 3, self.player.y + 1)
+        self.make_tile_wall(self.player.x + 2, self.player.y)
+
+        orc.ai.perform()
+
+        self.assertEqual(orc.x, self.player.x + 2)
+        self.assertNotEqual(orc.y, self.player.y)
+
+    def test_hostile_ai_sees_player_outside_player_fov(self):
+        """Monsters act on their own sight even when the player's FOV is empty."""
+        orc = self.place_orc(self.player.x + 4, self.player.y)
+
+        orc.ai.perform()
+
+        self.assertEqual(orc.x, self.player.x + 3)
+
+    def test_hostile_ai_sight_is_limited_by_radius(self):
+        """Monsters beyond the monster sight radius do not notice the player."""
+        radius = self.engine.config.monster_sight_radius
+        self.player.place(0, 0)
+        orc = self.place_orc(radius + 1, 0)
+
+        orc.ai.perform()
+
+        self.assertEqual(orc.x, radius + 1)
+
     def test_hostile_ai_waits_when_not_visible(self):
-        """Hostile AI with no path waits when player not visible."""
+        """Hostile AI with no path waits when it cannot see the player."""
         orc = self.place_orc(self.player.x + 3, self.player.y)
-        # Don't make area visible - orc can't see player
+        # A wall across the whole map blocks the orc's line of sight
+        for y in range(self.game_map.height):
+            self.make_tile_wall(self.player.x + 2, y)
         initial_x, initial_y = orc.x, orc.y
 
         orc.ai.perform()
 
-        # Orc should not have moved (no path, player not visible)
+        # Orc should not have moved (no path, player not seen)
         self.assertEqual(orc.x, initial_x)
         self.assertEqual(orc.y, initial_y)
 
 
+class TestHostileAIPathReuse(GameTestCase):
+    """Test HostileEnemy path caching.
+
+    Business Logic:
+    - A path still leading to the player is reused instead of replanned
+    - A player stepping next to the path end extends the path by one step
+    - A blocked next step forces a replan
+    - Replans are limited per enemy turn; without one the monster keeps its old plan or waits
+    - No path is stored until the monster first plans one
+    - A blocked path to a place the monster can no longer see is replanned, or dropped without a replan
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.orc = self.place_orc(self.player.x + 5, self.player.y)
+
+    def replans_used(self) -> int:
+        return self.engine.config.max_path_replans_per_turn - self.engine.path_replans_remaining
+
+    def test_no_path_is_allocated_until_planned(self):
+        """A new monster holds no path and counts as idle."""
+        self.assertIsNone(self.orc.ai.path)
+        self.assertTrue(self.orc.ai.is_idle)
+
+    def test_path_is_reused_while_player_stands_still(self):
+        """Only the first turn plans a path."""
+        self.orc.ai.perform()
+        self.orc.ai.perform()
+
+        self.assertEqual(self.replans_used(), 1)
+        self.assertEqual(self.orc.ai.path[-1], self.player.position)
+
+    def test_path_is_extended_when_player_steps_aside(self):
+        """A one-step player move appends to the path instead of replanning."""
+        self.orc.ai.perform()
+        self.player.move(0, 1)
+        self.orc.ai.perform()
+
+        self.assertEqual(self.replans_used(), 1)
+        self.assertEqual(self.orc.ai.path[-1], self.player.position)
+
+    def test_blocked_step_forces_replan(self):
+        """Another monster standing on the next step triggers a new plan."""
+        self.orc.ai.perform()
+        self.place_orc(*self.orc.ai.path[0])
+        self.orc.ai.perform()
+
+        self.assertEqual(self.replans_used(), 2)
+
+    def test_monster_waits_without_replan_budget(self):
+        """With no replans left and no path, the monster stays put."""
+        self.engine.path_replans_remaining = 0
+        start = self.orc.position
+
+        self.orc.ai.perform()
+
+        self.assertEqual(self.orc.position, start)
+
+    def block_sight_with_stale_path(self):
+        """Hide the player behind a wall and give the orc a two-step path whose first step is occupied."""
+        for y in range(self.game_map.height):
+            self.make_tile_wall(self.player.x + 2, y)
+        x, y = self.orc.position
+        self.orc.ai.path = deque([(x - 1, y), (x - 2, y)])
+        self.place_orc(x - 1, y)
+        return x - 2, y
+
+    def test_blocked_stale_path_is_replanned(self):
+        """An unseen player's last known position is still pursued around a blocker."""
+        goal = self.block_sight_with_stale_path()
+        start = self.orc.position
+
+        self.orc.ai.perform()
+
+        self.assertNotEqual(self.orc.position, start)
+        self.assertEqual(self.orc.ai.path[-1], goal)
+
+    def test_blocked_stale_path_is_dropped_without_budget(self):
+        """With no replans left a blocked stale path is given up, so the monster goes idle."""
+        self.block_sight_with_stale_path()
+        self.engine.path_replans_remaining = 0
+
+        self.orc.ai.perform()
+
+        self.assertTrue(self.orc.ai.is_idle)
+
+    def test_enemy_turn_resets_replan_budget(self):
+        """Each enemy turn starts with a full budget."""
+        self.engine.path_replans_remaining = 0
+        self.engine.handle_enemy_turns()
+        self.assertEqual(self.replans_used(), 1)
+
+
 class TestConfusedAI(GameTestCase):
     """Test ConfusedEnemy AI behavior."""
 
@@ -11,6 +11,8 @@ Business Logic Tested:
 - FOV updates reveal tiles around the player
 - Explored tiles remain explored after leaving FOV
 - Enemy turns process after player actions
+- Enemy turns follow the turn scheduler's speed-based order
+- Idle monsters outside the activity radius are parked until proximity or noise wakes them
 - Messages are logged during gameplay
 - Death ends the game appropriately
 - Complete gameplay scenarios work end-to-end
@@ -19,16 +21,24 @@ Business Logic Tested:
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import numpy as np
+import tcod.console
+from tcod.map import compute_fov
+
+from components.ai import BaseAI
 from config import GameConfig
 from engine import Engine
-from message_log import MessageLog
+from message_log import MessageLog, read_journal
 from tests.factories import GameFactory
 from tests.helpers import CombatTestCase, GameTestCase
+from turn_scheduler import NORMAL_SPEED
 
 
 class TestEngineInitialization(unittest.TestCase):
@@ -60,6 +70,16 @@ class TestEngineInitialization(unittest.TestCase):
         self.assertEqual(engine.config.screen_width, 100)
         self.assertEqual(engine.config.screen_height, 80)
 
+    def test_engine_rng_follows_config_seed(self):
+        """Engines built with the same seed draw the same random numbers."""
+        config = GameConfig(seed=42)
+        first = Engine(player=GameFactory.create_player(), config=config)
+        second = Engine(player=GameFactory.create_player(), config=config)
+        self.assertEqual(
+            [first.rng.random() for _ in range(5)],
+            [second.rng.random() for _ in range(5)],
+        )
+
 
 class TestFieldOfView(GameTestCase):
     """Test Field of View (FOV) calculations."""
@@ -107,6 +127,127 @@ class TestFieldOfView(GameTestCase):
         self.assertFalse(self.game_map.visible[initial_x, initial_y])
 
 
+class TestWindowedFieldOfView(GameTestCase):
+    """Test FOV computed over the radius window only.
+
+    Business Logic:
+    - The windowed result matches a full-map FOV computation
+    - Nothing is recomputed while the player stands still and tiles are unchanged
+    - Tile changes force a recompute even if the player did not move
+    """
+
+    def full_fov(self):
+        return compute_fov(
+            self.game_map.tiles['transparent'],
+            (self.player.x, self.player.y),
+            radius=self.engine.config.fov_radius,
+        )
+
+    def test_windowed_fov_matches_full_fov(self):
+        """Cropping to the radius window gives the same visible area."""
+        game = GameFactory.create_game(config=GameConfig(fov_radius=4), map_width=30, map_height=30)
+        self.player, self.engine, self.game_map = game.player, game.engine, game.game_map
+        self.make_tile_wall(17, 15)
+        self.make_tile_wall(13, 14)
+
+        for x, y in ((15, 15), (2, 3), (28, 29), (20, 10)):
+            self.player.place(x, y)
+            self.engine.update_fov()
+            np.testing.assert_array_equal(self.game_map.visible, self.full_fov())
+
+    def test_unchanged_fov_is_not_recomputed(self):
+        """A second update with nothing changed leaves the visible array alone."""
+        self.engine.update_fov()
+        self.game_map.visible[0, 0] = True
+        self.engine.update_fov()
+        self.assertTrue(self.game_map.visible[0, 0])
+
+    def test_tile_change_forces_recompute(self):
+        """Walls added after an update block sight on the next update."""
+        self.engine.update_fov()
+        self.assertTrue(self.game_map.visible[self.player.x + 2, self.player.y])
+
+        self.make_tile_wall(self.player.x + 1, self.player.y)
+        self.engine.update_fov()
+
+        self.assertFalse(self.game_map.visible[self.player.x + 2, self.player.y])
+
+
+class TestVisibleEntities(GameTestCase):
+    """Test the per-update list of entities in view.
+
+    Business Logic:
+    - update_fov records every entity standing on a visible tile
+    - Entities that came into or went out of view since the last update are listed separately
+    - Entity movement is picked up even when the visible area itself is unchanged
+    - The list is only rebuilt after visibility or entity positions change
+    """
+
+    def test_update_fov_lists_entities_in_view(self):
+        """Nearby entities are listed, distant ones are not."""
+        near = self.place_orc(self.player.x + 2, self.player.y)
+        far = self.place_orc(0, 0)
+        self.engine.update_fov()
+
+        self.assertIn(self.player, self.game_map.visible_entities)
+        self.assertIn(near, self.game_map.visible_entities)
+        self.assertNotIn(far, self.game_map.visible_entities)
+
+    def test_entering_view_is_reported_once(self):
+        """An entity appears in entered_view only on the update where it came into view."""
+        orc = self.place_orc(self.player.x + 2, self.player.y)
+        self.engine.update_fov()
+        self.assertIn(orc, self.game_map.entered_view)
+
+        self.engine.update_fov()
+        self.assertEqual(self.game_map.entered_view, [])
+        self.assertIn(orc, self.game_map.visible_entities)
+
+    def test_leaving_view_is_reported(self):
+        """An entity that walks out of view is listed in left_view."""
+        orc = self.place_orc(self.player.x + 2, self.player.y)
+        self.engine.update_fov()
+
+        orc.place(0, 0)
+        self.player.place(19, 19)
+        self.engine.update_fov()
+
+        self.assertIn(orc, self.game_map.left_view)
+        self.assertNotIn(orc, self.game_map.visible_entities)
+
+    def test_movement_without_fov_change_is_tracked(self):
+        """An entity stepping into view is noticed even if the player did not move."""
+        self.make_tile_wall(self.player.x + 2, self.player.y)
+        self.engine.update_fov()
+        orc = self.place_orc(self.player.x + 3, self.player.y)
+        self.engine.update_fov()
+        self.assertNotIn(orc, self.game_map.visible_entities)
+
+        orc.place(self.player.x + 1, self.player.y)
+        self.engine.update_fov()
+
+        self.assertEqual(self.game_map.entered_view, [orc])
+
+    def test_unchanged_view_reuses_list(self):
+        """With nothing moved and the FOV unchanged, the list is not rebuilt."""
+        self.place_orc(self.player.x + 2, self.player.y)
+        self.engine.update_fov()
+        in_view = self.game_map.visible_entities
+
+        self.engine.update_fov()
+
+        self.assertIs(self.game_map.visible_entities, in_view)
+        self.assertEqual((self.game_map.entered_view, self.game_map.left_view), ([], []))
+
+    def test_queries_see_moves_before_next_update(self):
+        """Targeting picks up a monster that stepped into view since the last FOV update."""
+        self.engine.update_fov()
+        orc = self.place_orc(self.player.x + 2, self.player.y)
+
+        self.assertIn(orc, self.game_map.visible_entities)
+        self.assertIs(self.game_map.get_nearest_visible_actor(self.player.x, self.player.y, exclude=self.player), orc)
+
+
 class TestEnemyTurns(GameTestCase):
     """Test enemy turn processing."""
 
@@ -147,10 +288,211 @@ class TestEnemyTurns(GameTestCase):
         # Dead orc shouldn't attack
         self.assertEqual(self.player.fighter.hp, initial_player_hp)
 
+    def test_fast_enemy_acts_twice_per_turn(self):
+        """A double-speed monster attacks twice for each player action."""
+        orc = self.place_orc(self.player.x + 1, self.player.y)
+        orc.speed = NORMAL_SPEED * 2
+        initial_player_hp = self.player.fighter.hp
+
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.player.fighter.hp, initial_player_hp - 2)
+
+    def test_slow_enemy_acts_every_other_turn(self):
+        """A half-speed monster attacks once over two player actions."""
+        orc = self.place_orc(self.player.x + 1, self.player.y)
+        orc.speed = NORMAL_SPEED // 2
+        initial_player_hp = self.player.fighter.hp
+
+        self.engine.handle_enemy_turns()
+        self.engine.handle_enemy_turns()
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.player.fighter.hp, initial_player_hp - 2)
+
+    def test_enemies_act_in_placement_order(self):
+        """Monsters due at the same time act in the order they were added."""
+        acted = []
+
+        class RecordingAI(BaseAI):
+            def perform(self) -> None:
+                acted.append(self.entity)
+
+        first = self.place_orc(2, 2)
+        second = self.place_orc(4, 4)
+        for orc in (second, first):
+            orc.ai = RecordingAI(orc)
+
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(acted, [first, second])
+
+
+class TestActivityRadius(GameTestCase):
+    """Test parking distant monsters and waking them again.
+
+    Business Logic:
+    - Idle monsters farther than activity_radius (Chebyshev) from the player are parked
+    - Parked monsters cost nothing per turn until the player comes back in range
+    - Noise wakes parked monsters in earshot and sends hostile ones toward it
+    - An activity_radius of zero or less keeps every monster active
+    - Monsters that can see the player are never parked
+    - Monsters that die while parked leave the dormant set
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine.config = replace(self.engine.config, activity_radius=3, monster_sight_radius=3)
+        self.acted = []
+        acted = self.acted
+
+        class RecordingAI(BaseAI):
+            def perform(self) -> None:
+                acted.append(self.entity)
+
+        self.recording_ai = RecordingAI
+
+    def place_recorder(self, x: int, y: int):
+        orc = self.place_orc(x, y)
+        orc.ai = self.recording_ai(orc)
+        return orc
+
+    def test_distant_idle_monster_is_parked(self):
+        """A monster outside the radius does not act and leaves the schedule."""
+        orc = self.place_recorder(2, 2)
+
+        self.engine.handle_enemy_turns()
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [])
+        self.assertIn(orc, self.engine.scheduler.dormant)
+        self.assertNotIn(orc, self.engine.scheduler)
+
+    def test_nearby_monster_keeps_acting(self):
+        """A monster inside the radius acts every turn."""
+        orc = self.place_recorder(self.player.x + 3, self.player.y + 3)
+
+        self.engine.handle_enemy_turns()
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [orc, orc])
+
+    def test_parked_monster_wakes_when_player_approaches(self):
+        """Coming back within the radius returns a monster to the schedule."""
+        orc = self.place_recorder(2, 2)
+        self.engine.handle_enemy_turns()
+
+        self.player.place(4, 4, self.game_map)
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [orc])
+        self.assertNotIn(orc, self.engine.scheduler.dormant)
+
+    def test_noise_wakes_hostile_monster_and_sets_path(self):
+        """A parked hostile monster heads for a noise it hears."""
+        for y in range(self.game_map.height):
+            self.make_tile_wall(5, y)
+        orc = self.place_orc(2, 2)
+        self.engine.handle_enemy_turns()
+        self.assertIn(orc, self.engine.scheduler.dormant)
+
+        self.engine.make_noise(4, 4, 5)
+
+        self.assertIn(orc, self.engine.scheduler)
+        self.assertEqual(orc.ai.path[-1], (4, 4))
+
+    def test_noise_out_of_earshot_is_ignored(self):
+        """Monsters beyond the noise radius stay parked."""
+        orc = self.place_recorder(2, 2)
+        self.engine.handle_enemy_turns()
+
+        self.engine.make_noise(12, 12, 3)
+
+        self.assertIn(orc, self.engine.scheduler.dormant)
+
+    def test_non_positive_radius_keeps_everyone_active(self):
+        """With activity_radius <= 0 distant monsters still act."""
+        self.engine.config = replace(self.engine.config, activity_radius=0)
+        orc = self.place_recorder(2, 2)
+
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [orc])
+
+    def test_monster_killed_while_parked_leaves_dormant_set(self):
+        """A corpse is dropped from the dormant set instead of staying there forever."""
+        orc = self.place_recorder(2, 2)
+        self.engine.handle_enemy_turns()
+        self.assertIn(orc, self.engine.scheduler.dormant)
+
+        orc.fighter.take_damage(orc.fighter.hp)
+
+        self.assertNotIn(orc, self.engine.scheduler.dormant)
+
+    def test_monster_in_sight_is_not_parked(self):
+        """Sight reaching past the activity radius keeps a watching monster active."""
+        self.engine.config = replace(self.engine.config, monster_sight_radius=10)
+        orc = self.place_recorder(2, 10)
+        self.assertTrue(orc.ai.can_see_player())
+
+        self.engine.handle_enemy_turns()
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [orc, orc])
+        self.assertNotIn(orc, self.engine.scheduler.dormant)
+
+    def test_unlimited_sight_keeps_everyone_active(self):
+        """With monster sight across the whole map no monster is parked."""
+        self.engine.config = replace(self.engine.config, monster_sight_radius=0)
+        orc = self.place_recorder(2, 2)
+
+        self.engine.handle_enemy_turns()
+
+        self.assertEqual(self.acted, [orc])
+
+
+class TestPlayerDistanceMap(GameTestCase):
+    """Test the shared distance map that hostile AIs follow toward the player.
+
+    Business Logic:
+    - Distance is zero on the player's tile and grows with walking cost
+    - One map serves every monster during a turn
+    - A new map is built when the player moves or a new turn starts
+    """
+
+    def test_distance_zero_at_player(self):
+        """The player's tile is the root of the map."""
+        distance = self.engine.player_distance_map
+        self.assertEqual(distance[self.player.x, self.player.y], 0)
+        self.assertEqual(distance[self.player.x + 1, self.player.y], 2)
+
+    def test_walls_are_unreachable(self):
+        """Walls never get a finite distance."""
+        self.make_tile_wall(3, 3)
+        distance = self.engine.player_distance_map
+        self.assertGreater(distance[3, 3], distance[self.player.x + 1, self.player.y] * 100)
+
+    def test_map_shared_within_turn(self):
+        """Repeated lookups reuse the same map while the player stands still."""
+        self.assertIs(self.engine.player_distance_map, self.engine.player_distance_map)
+
+    def test_map_rebuilt_after_player_moves(self):
+        """Moving the player produces a new map rooted at the new tile."""
+        first = self.engine.player_distance_map
+        self.player.move(1, 0)
+        second = self.engine.player_distance_map
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second[self.player.x, self.player.y], 0)
+
 
 class TestMessageLog(unittest.TestCase):
     """Test MessageLog functionality."""
 
+    @staticmethod
+    def row_text(console, x, y, length):
+        return ''.join(chr(ch) for ch in console.ch[x:x + length, y])
+
     def test_message_log_starts_empty(self):
         """New message log has no messages."""
         log = MessageLog()
@@ -195,6 +537,67 @@ class TestMessageLog(unittest.TestCase):
 
         self.assertEqual(log.messages[0].full_text, "Hit! (x2)")
 
+    def test_wrapped_lines_are_cached(self):
+        """Wrapping the same message at the same width reuses the lines."""
+        log = MessageLog()
+        log.add_message("The orc attacks the player for 3 hit points.")
+        message = log.messages[0]
+
+        lines = message.wrapped(20)
+
+        self.assertEqual(lines, ("The orc attacks the", "player for 3 hit", "points."))
+        self.assertIs(message.wrapped(20), lines)
+        self.assertEqual(message.wrapped(40), ("The orc attacks the player for 3 hit", "points."))
+
+    def test_wrapped_lines_follow_stack_count(self):
+        """Stacking a message rewraps it with the new count."""
+        log = MessageLog()
+        log.add_message("Hit!")
+        message = log.messages[0]
+        self.assertEqual(message.wrapped(20), ("Hit!",))
+
+        log.add_message("Hit!")
+
+        self.assertEqual(message.wrapped(20), ("Hit! (x2)",))
+
+    def test_version_changes_with_contents(self):
+        """Adding, stacking and clearing all bump the log version."""
+        log = MessageLog()
+        versions = [log.version]
+        log.add_message("Hit!")
+        versions.append(log.version)
+        log.add_message("Hit!")
+        versions.append(log.version)
+        log.clear()
+        versions.append(log.version)
+
+        self.assertEqual(len(set(versions)), 4)
+
+    def test_render_draws_newest_message_at_bottom(self):
+        """The panel shows the newest message on its last line."""
+        log = MessageLog()
+        log.add_message("First")
+        log.add_message("Second")
+        console = tcod.console.Console(30, 10, order='F')
+
+        log.render(console, x=2, y=3, width=20, height=4)
+
+        self.assertEqual(self.row_text(console, 2, 6, 6), "Second")
+        self.assertEqual(self.row_text(console, 2, 5, 5), "First")
+
+    def test_render_reflects_new_messages(self):
+        """A cached panel is redrawn once the log changes."""
+        log = MessageLog()
+        log.add_message("First")
+        console = tcod.console.Console(30, 10, order='F')
+        log.render(console, x=0, y=0, width=20, height=2)
+
+        log.add_message("Second")
+        log.render(console, x=0, y=0, width=20, height=2)
+
+        self.assertEqual(self.row_text(console, 0, 1, 6), "Second")
+        self.assertEqual(self.row_text(console, 0, 0, 5), "First")
+
     def test_different_messages_dont_stack(self):
         """Different messages don't stack together."""
         log = MessageLog()
@@ -204,6 +607,75 @@ class TestMessageLog(unittest.TestCase):
 
         self.assertEqual(len(log.messages), 3)
 
+    def test_log_keeps_only_newest_messages(self):
+        """A full log drops its oldest message for each new one."""
+        log = MessageLog(capacity=3)
+        for index in range(5):
+            log.add_message(f"Message {index}")
+
+        self.assertEqual([m.plain_text for m in log.messages], ["Message 2", "Message 3", "Message 4"])
+
+    def test_capacity_must_be_positive(self):
+        """A log that could not hold even one message is refused up front."""
+        with self.assertRaises(ValueError):
+            MessageLog(capacity=0)
+
+    def test_dropped_messages_spill_to_journal(self):
+        """Messages pushed out of the log are written to the journal in order."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "journal.bin"
+            log = MessageLog(capacity=2, journal_path=path)
+            log.add_message("Hit!", fg=(255, 0, 0))
+            log.add_message("Hit!", fg=(255, 0, 0))
+            log.add_message("Miss")
+            log.add_message("Heal")
+            log.add_message("Done")
+            log.close()
+
+            spilled = list(read_journal(path))
+
+        self.assertEqual(
+            [(m.plain_text, m.fg, m.count) for m in spilled],
+            [("Hit!", (255, 0, 0), 2), ("Miss", (255, 255, 255), 1)],
+        )
+
+    def test_journal_keeps_long_messages(self):
+        """Messages longer than 64 KiB, such as tracebacks, spill intact."""
+        text = "x" * 70_000
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "journal.bin"
+            log = MessageLog(capacity=1, journal_path=path)
+            log.add_message(text)
+            log.add_message("Next")
+            log.close()
+
+            spilled = list(read_journal(path))
+
+        self.assertEqual([m.plain_text for m in spilled], [text])
+
+    def test_flush_writes_spilled_messages(self):
+        """flush makes spilled messages readable while the journal stays open."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "journal.bin"
+            log = MessageLog(capacity=1, journal_path=path)
+            log.add_message("First")
+            log.add_message("Second")
+            log.flush()
+
+            spilled = list(read_journal(path))
+            log.close()
+
+        self.assertEqual([m.plain_text for m in spilled], ["First"])
+
+    def test_newest_first_stops_before_index(self):
+        """History views walk backwards from the given index without copying."""
+        log = MessageLog()
+        for text in ("a", "b", "c", "d"):
+            log.add_message(text)
+
+        self.assertEqual([m.plain_text for m in log.newest_first(2)], ["b", "a"])
+        self.assertEqual([m.plain_text for m in log.newest_first()], ["d", "c", "b", "a"])
+
 
 class TestGameplayIntegration(GameTestCase):
     """Integration tests for complete gameplay scenarios."""
@@ -11,6 +11,7 @@ Business Logic Tested:
 - Actors have a living/dead state based on AI presence
 - Actors block movement, items do not
 - Spawning creates independent copies of entities
+- Templates build fresh entities with their own components
 """
 
 from __future__ import annotations
@@ -21,6 +22,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import entity_factories
 from entity.base_entity import Entity
 from render_order import RenderOrder
 from tests.factories import GameFactory
@@ -171,6 +173,45 @@ class TestEntitySpawning(GameTestCase):
         self.assertEqual(spawned_orc.fighter.hp, 5)
 
 
+class TestTemplateSpawning(GameTestCase):
+    """Test spawning entities from templates."""
+
+    def test_actor_template_spawns_on_map(self):
+        """An actor template places a new actor at the given location."""
+        orc = entity_factories.ORC_TEMPLATE.spawn(self.game_map, 4, 6)
+        self.assertEqual(orc.position, (4, 6))
+        self.assertIs(orc.parent, self.game_map)
+        self.assertIs(self.game_map.get_blocking_entity_at_location(4, 6), orc)
+
+    def test_actor_template_builds_independent_components(self):
+        """Each spawned actor has its own fighter and AI."""
+        first = entity_factories.ORC_TEMPLATE.spawn(self.game_map, 4, 6)
+        second = entity_factories.ORC_TEMPLATE.spawn(self.game_map, 5, 6)
+
+        first.fighter.take_damage(5)
+
+        self.assertEqual(second.fighter.hp, entity_factories.ORC_TEMPLATE.hp)
+        self.assertIs(first.fighter.parent, first)
+        self.assertIs(second.ai.entity, second)
+
+    def test_item_template_builds_independent_consumables(self):
+        """Each spawned item owns a fresh consumable."""
+        first = entity_factories.HEALTH_POTION_TEMPLATE.spawn(self.game_map, 4, 6)
+        second = entity_factories.HEALTH_POTION_TEMPLATE.spawn(self.game_map, 5, 6)
+
+        self.assertIsNot(first.consumable, second.consumable)
+        self.assertIs(first.consumable.parent, first)
+        self.assertIs(second.consumable.parent, second)
+
+    def test_spawned_entities_have_no_instance_dict(self):
+        """Entities and their components are slotted to keep per-entity memory low."""
+        orc = entity_factories.ORC_TEMPLATE.spawn(self.game_map, 4, 6)
+        potion = entity_factories.HEALTH_POTION_TEMPLATE.spawn(self.game_map, 5, 6)
+
+        for obj in (orc, orc.fighter, orc.inventory, orc.ai, potion, potion.consumable):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
+
 class TestActorProperties(GameTestCase):
     """Test Actor-specific properties and behavior."""
 
@@ -0,0 +1,121 @@
+"""Tests for headless simulation.
+
+These tests verify that games can be set up and played without a window:
+- new_game builds a playable engine
+- Scripted and bot-driven actions advance turns through the normal handler path
+- Runs stop on death, when the bot stops, or at the turn limit
+
+Business Logic Tested:
+- Only successful actions count as turns
+- Enemies act and FOV updates after each player turn
+- A dead player ends the simulation
+- Seeded runs are reproducible
+"""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from actions import BumpAction, WaitAction
+from config import GameConfig
+from headless import SimulationResult, hunter_bot, run_headless, scripted_bot, simulate_games
+from setup_game import new_game
+from tests.helpers import GameTestCase
+
+SMALL_CONFIG = GameConfig(map_width=40, map_height=30, max_rooms=8)
+
+
+class TestNewGame(unittest.TestCase):
+    """Test headless game setup."""
+
+    def test_new_game_places_player_on_map(self):
+        """The player starts on a walkable tile of the generated map."""
+        engine = new_game(SMALL_CONFIG)
+        player = engine.player
+        self.assertIn(player, engine.game_map.entities)
+        self.assertTrue(engine.game_map.tiles['walkable'][player.x, player.y])
+
+    def test_new_game_computes_initial_fov(self):
+        """The player's surroundings are visible before the first turn."""
+        engine = new_game(SMALL_CONFIG)
+        self.assertTrue(engine.game_map.visible[engine.player.x, engine.player.y])
+
+
+class TestRunHeadless(GameTestCase):
+    """Test driving a game with scripted actions and bots."""
+
+    def test_scripted_actions_advance_turns(self):
+        """Each successful scripted action is one turn."""
+        script = [WaitAction(self.player) for _ in range(3)]
+        result = run_headless(self.engine, scripted_bot(script))
+        self.assertEqual(result.turns, 3)
+        self.assertEqual(result.actions, 3)
+
+    def test_impossible_actions_do_not_count_as_turns(self):
+        """Blocked moves are attempted but do not advance the turn."""
+        self.make_tile_wall(self.player.x + 1, self.player.y)
+        script = [BumpAction(self.player, 1, 0), WaitAction(self.player)]
+        result = run_headless(self.engine, scripted_bot(script))
+        self.assertEqual(result.turns, 1)
+        self.assertEqual(result.actions, 2)
+
+    def test_enemies_act_after_player_turn(self):
+        """Monsters get their turn after each player action."""
+        self.place_orc(self.player.x + 1, self.player.y)
+        self.make_area_visible(0, 0, 20, 20)
+
+        run_headless(self.engine, scripted_bot([WaitAction(self.player)]))
+
+        self.assertPlayerHP(self.player.fighter.max_hp - 1)
+
+    def test_run_stops_when_player_dies(self):
+        """A dead player ends the run even if the bot has more actions."""
+        self.place_troll(self.player.x + 1, self.player.y, power=50)
+        self.make_area_visible(0, 0, 20, 20)
+
+        result = run_headless(self.engine, scripted_bot(WaitAction(self.player) for _ in range(10)))
+
+        self.assertFalse(result.player_alive)
+        self.assertEqual(result.turns, 1)
+
+    def test_run_stops_at_turn_limit(self):
+        """max_turns caps the length of a run."""
+        result = run_headless(self.engine, lambda engine: WaitAction(engine.player), max_turns=5)
+        self.assertEqual(result.turns, 5)
+
+    def test_hunter_bot_kills_adjacent_monster(self):
+        """The bundled bot attacks visible monsters."""
+        self.place_orc(self.player.x + 1, self.player.y, hp=1)
+        self.make_area_visible(0, 0, 20, 20)
+
+        result = run_headless(self.engine, hunter_bot, max_turns=1)
+
+        self.assertEqual(result.monsters_killed, 1)
+
+
+class TestSimulateGames(unittest.TestCase):
+    """Test batches of headless games."""
+
+    def test_simulate_games_returns_one_result_per_game(self):
+        """Every requested game produces a result."""
+        results = simulate_games(2, config=SMALL_CONFIG, max_turns=20)
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIsInstance(result, SimulationResult)
+            self.assertLessEqual(result.turns, 20)
+
+    def test_seeded_batches_are_reproducible(self):
+        """The same seed replays the same dungeons and turn sequences."""
+        config = GameConfig(map_width=40, map_height=30, max_rooms=8, seed=99)
+        self.assertEqual(
+            simulate_games(3, config=config, max_turns=200),
+            simulate_games(3, config=config, max_turns=200),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import tcod.console
 from tcod.event import KeySym, Modifier
 
 from input_handlers.consts import (
@@ -31,6 +32,7 @@ from input_handlers.consts import (
     MOVE_KEYS,
     WAIT_KEYS,
 )
+from tests.factories import GameFactory
 from tests.helpers import GameTestCase
 
 
@@ -192,6 +194,46 @@ class TestInventoryEventHandler(GameTestCase):
         self.assertNotEqual(activate_handler.TITLE, '<missing title>')
         self.assertNotEqual(drop_handler.TITLE, '<missing title>')
 
+    def test_inventory_menu_lists_items(self):
+        """The menu shows one lettered line per item inside its frame."""
+        from input_handlers.inventory_activate_handler import InventoryActivateHandler
+
+        self.add_item_to_inventory(GameFactory.create_health_potion())
+        console = tcod.console.Console(80, 60, order='F')
+
+        InventoryActivateHandler(self.engine).on_render(console)
+
+        line = ''.join(chr(ch) for ch in console.ch[41:47, 1])
+        self.assertEqual(line, '(a) He')
+
+    def test_menu_panel_reused_across_handlers(self):
+        """Reopening a menu with unchanged contents reuses the pooled drawing."""
+        from input_handlers.inventory_activate_handler import InventoryActivateHandler
+
+        console = tcod.console.Console(80, 60, order='F')
+        InventoryActivateHandler(self.engine).on_render(console)
+        panel = self.engine.panels['menu']
+        menu, key = panel.console, panel.key
+
+        InventoryActivateHandler(self.engine).on_render(console)
+
+        self.assertIs(panel.console, menu)
+        self.assertEqual(panel.key, key)
+
+    def test_menu_panel_redrawn_when_inventory_changes(self):
+        """Picking up an item changes the menu's key and redraws it."""
+        from input_handlers.inventory_activate_handler import InventoryActivateHandler
+
+        console = tcod.console.Console(80, 60, order='F')
+        handler = InventoryActivateHandler(self.engine)
+        handler.on_render(console)
+        key = self.engine.panels['menu'].key
+
+        self.add_item_to_inventory(GameFactory.create_health_potion())
+        handler.on_render(console)
+
+        self.assertNotEqual(self.engine.panels['menu'].key, key)
+
 
 class TestGameOverEventHandler(GameTestCase):
     """Test GameOverEventHandler behavior."""
@@ -238,6 +280,29 @@ class TestHistoryViewer(GameTestCase):
         handler = HistoryViewer(self.engine)
         self.assertEqual(handler.log_length, 2)
 
+    def test_history_viewer_reuses_panel_until_cursor_moves(self):
+        """The history panel is drawn once and reused until the cursor moves."""
+        from input_handlers.history_viewer import HistoryViewer
+
+        drawn = []
+
+        class CountingViewer(HistoryViewer):
+            def draw_history(self, log_console):
+                drawn.append(self.cursor)
+                super().draw_history(log_console)
+
+        self.engine.message_log.add_message("Test")
+        self.engine.message_log.add_message("Test 2")
+        handler = CountingViewer(self.engine)
+        console = tcod.console.Console(80, 60, order='F')
+
+        handler.on_render(console)
+        handler.on_render(console)
+        handler.cursor = 0
+        handler.on_render(console)
+
+        self.assertEqual(drawn, [1, 0])
+
 
 class TestSelectIndexHandler(GameTestCase):
     """Test SelectIndexHandler for targeting."""
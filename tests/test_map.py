@@ -13,17 +13,28 @@ Business Logic Tested:
 - Tunnels connect rooms
 - Player starts in first room
 - Monsters and items spawn correctly
+- The actor store mirrors actor state for array queries
+- The same seed generates the same dungeon
+- Map layers can live in memory-mapped files and be flushed to disk
 """
 
 from __future__ import annotations
 
+import gc
+import random
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import numpy as np
+import tcod.console
+
+from config import GameConfig
 from map_objects import tile_types
+from map_objects.actor_store import DistanceMetric
 from map_objects.game_map import GameMap
 from map_objects.procgen import RectangularRoom, generate_dungeon, tunnel_between
 from tests.factories import GameFactory
@@ -133,6 +144,206 @@ class TestGameMapEntities(GameTestCase):
         self.assertIn(potion, entities)
 
 
+class TestGameMapSpatialIndex(GameTestCase):
+    """Test that position queries follow entities as they change position.
+
+    Business Logic:
+    - Moving, placing and spawning keep the per-tile index current
+    - Entities leaving the map are no longer found at their old tile
+    """
+
+    def test_index_follows_move(self):
+        """A moved entity is found at its new tile and not its old one."""
+        orc = self.place_orc(5, 5)
+        orc.move(1, 0)
+
+        self.assertIsNone(self.game_map.get_blocking_entity_at_location(5, 5))
+        self.assertIs(self.game_map.get_actor_at_location(6, 5), orc)
+
+    def test_index_follows_place(self):
+        """Placing an entity on the same map re-indexes it."""
+        orc = self.place_orc(5, 5)
+        orc.place(8, 9)
+
+        self.assertEqual(list(self.game_map.get_entities_at(5, 5)), [])
+        self.assertIs(self.game_map.get_blocking_entity_at_location(8, 9), orc)
+
+    def test_index_follows_spawn(self):
+        """Spawned entities are immediately queryable at their tile."""
+        orc = GameFactory.create_orc().spawn(self.game_map, 3, 4)
+        self.assertIs(self.game_map.get_actor_at_location(3, 4), orc)
+
+    def test_place_on_new_map_clears_old_index(self):
+        """Moving to another map removes the entity from the old map's index."""
+        orc = self.place_orc(5, 5)
+        new_map = GameFactory.create_map(self.engine, 10, 10)
+
+        orc.place(2, 2, new_map)
+
+        self.assertIsNone(self.game_map.get_actor_at_location(5, 5))
+        self.assertIs(new_map.get_actor_at_location(2, 2), orc)
+
+    def test_pickup_removes_item_from_index(self):
+        """Picked up items are no longer found on the map tile."""
+        from actions import PickupAction
+
+        self.place_health_potion(self.player.x, self.player.y)
+        PickupAction(self.player).perform()
+
+        entities = list(self.game_map.get_entities_at(self.player.x, self.player.y))
+        self.assertEqual(entities, [self.player])
+
+
+class TestGameMapPathCost(GameTestCase):
+    """Test the shared pathfinding cost grid.
+
+    Business Logic:
+    - Walls cost 0 (impassable), floor costs 1
+    - Living blockers add a penalty so paths route around them
+    - The grid follows blockers as they move, spawn and die
+    """
+
+    def test_blocker_adds_penalty(self):
+        """A blocking actor raises the cost of its tile."""
+        self.place_orc(5, 5)
+        self.assertEqual(self.game_map.path_cost[5, 5], 11)
+        self.assertEqual(self.game_map.path_cost[6, 5], 1)
+
+    def test_penalty_follows_movement(self):
+        """Moving a blocker moves its penalty."""
+        orc = self.place_orc(5, 5)
+        cost = self.game_map.path_cost
+        orc.move(1, 0)
+
+        self.assertEqual(cost[5, 5], 1)
+        self.assertEqual(cost[6, 5], 11)
+
+    def test_penalty_added_on_spawn(self):
+        """Spawning a blocker after the grid exists patches it."""
+        cost = self.game_map.path_cost
+        GameFactory.create_orc().spawn(self.game_map, 3, 3)
+        self.assertEqual(cost[3, 3], 11)
+
+    def test_penalty_cleared_on_death(self):
+        """Corpses no longer add a penalty."""
+        orc = self.place_orc(5, 5)
+        cost = self.game_map.path_cost
+        orc.fighter.take_damage(orc.fighter.hp)
+        self.assertEqual(cost[5, 5], 1)
+
+    def test_mark_tiles_changed_rebuilds_grid(self):
+        """Tile edits are picked up after mark_tiles_changed."""
+        self.assertEqual(self.game_map.path_cost[4, 4], 1)
+        self.make_tile_wall(4, 4)
+        self.assertEqual(self.game_map.path_cost[4, 4], 0)
+
+
+class TestActorStore(GameTestCase):
+    """Test the structure-of-arrays actor store behind GameMap.actors.
+
+    Business Logic:
+    - Every actor on the map has a row mirroring its position, stats and state
+    - Moves, damage, stat changes and death write through to the store
+    - Removing an actor keeps the remaining rows intact
+    """
+
+    def row(self, actor):
+        store = self.game_map.actor_store
+        slot = store.select(np.ones(len(store), dtype=bool)).index(actor)
+        return {name: store.column(name)[slot].item() for name in ('x', 'y', 'hp', 'power', 'alive', 'blocks')}
+
+    def test_spawned_actor_is_stored(self):
+        """Placing an actor fills its row."""
+        orc = self.place_orc(5, 6, hp=7, power=2)
+        self.assertEqual(
+            self.row(orc),
+            {'x': 5, 'y': 6, 'hp': 7, 'power': 2, 'alive': True, 'blocks': True},
+        )
+
+    def test_changes_write_through(self):
+        """Moves, damage and stat changes update the row."""
+        orc = self.place_orc(5, 6, hp=7)
+        orc.move(1, 1)
+        orc.fighter.take_damage(3)
+        orc.fighter.power = 9
+
+        row = self.row(orc)
+        self.assertEqual((row['x'], row['y'], row['hp'], row['power']), (6, 7, 4, 9))
+
+    def test_death_clears_alive_and_blocks(self):
+        """Dead actors drop out of GameMap.actors."""
+        orc = self.place_orc(5, 6)
+        orc.fighter.take_damage(orc.fighter.hp)
+
+        row = self.row(orc)
+        self.assertFalse(row['alive'])
+        self.assertFalse(row['blocks'])
+        self.assertNotIn(orc, list(self.game_map.actors))
+
+    def test_removal_keeps_other_rows(self):
+        """Removing an actor moves another into its slot without corrupting it."""
+        first = self.place_orc(2, 2)
+        second = self.place_orc(3, 3)
+        self.game_map.remove_entity(first)
+
+        self.assertNotIn(first, self.game_map.actor_store)
+        self.assertEqual((self.row(second)['x'], self.row(second)['y']), (3, 3))
+        self.assertEqual(set(self.game_map.actors), {self.player, second})
+
+    def test_store_grows_past_initial_capacity(self):
+        """Many actors can be stored."""
+        orcs = [self.place_orc(x, y) for x in range(20) for y in range(10) if (x, y) != self.player.position]
+        self.assertEqual(len(self.game_map.actor_store), len(orcs) + 1)
+        self.assertEqual(self.row(orcs[-1])['y'], orcs[-1].y)
+
+    def test_actors_in_radius_euclidean(self):
+        """Euclidean radius excludes the far corners of the square."""
+        near = self.place_orc(5, 7)
+        self.place_orc(7, 7)
+        self.assertEqual(self.game_map.get_actors_in_radius(5, 5, 2), [near])
+
+    def test_actors_in_radius_chebyshev(self):
+        """Chebyshev radius covers the whole square."""
+        near = self.place_orc(5, 7)
+        corner = self.place_orc(7, 7)
+        self.place_orc(8, 5)
+        found = self.game_map.get_actors_in_radius(5, 5, 2, DistanceMetric.CHEBYSHEV)
+        self.assertEqual(set(found), {near, corner})
+
+    def test_actors_in_radius_skips_dead(self):
+        """Corpses are not returned by area queries."""
+        orc = self.place_orc(5, 6)
+        orc.fighter.take_damage(orc.fighter.hp)
+        self.assertEqual(self.game_map.get_actors_in_radius(5, 5, 3), [])
+
+    def test_nearest_visible_actor(self):
+        """The closest visible actor wins over farther and unseen ones."""
+        self.make_area_visible(0, 0, 20, 20)
+        self.set_visible(11, 10, visible=False)
+        self.place_orc(11, 10)
+        near = self.place_orc(12, 10)
+        self.place_orc(14, 10)
+
+        found = self.game_map.get_nearest_visible_actor(10, 10, exclude=self.player)
+        self.assertIs(found, near)
+
+    def test_nearest_visible_actor_range_is_exclusive(self):
+        """Actors exactly max_distance away are out of range."""
+        self.make_area_visible(0, 0, 20, 20)
+        self.place_orc(13, 10)
+
+        self.assertIsNone(self.game_map.get_nearest_visible_actor(10, 10, 3, exclude=self.player))
+        self.assertIsNotNone(self.game_map.get_nearest_visible_actor(10, 10, 3.5, exclude=self.player))
+
+    def test_visible_actors_uses_fov(self):
+        """Only living actors on visible tiles are returned."""
+        seen = self.place_orc(2, 2)
+        self.place_orc(15, 15)
+        self.make_area_visible(0, 0, 5, 5)
+
+        self.assertEqual(self.game_map.get_visible_actors(), [seen])
+
+
 class TestGameMapTiles(GameTestCase):
     """Test GameMap tile functionality."""
 
@@ -183,6 +394,253 @@ class TestGameMapVisibility(GameTestCase):
         self.assertTrue(self.game_map.visible[4, 4])
 
 
+class TestGameMapStorage(GameTestCase):
+    """Test memory-mapped map layers.
+
+    Business Logic:
+    - Without a storage directory the layers are ordinary in-memory arrays
+    - With one, tiles, visible and explored are .npy files mapped into memory
+    - New mapped maps start as walls, unseen and unexplored
+    - flush writes changes through so the files can be read back
+    - Maps sharing a storage directory never share layer files
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.storage_dir = Path(self.directory.name) / 'floor'
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_layers_in_memory_by_default(self):
+        """Maps without a storage directory do not use memory maps."""
+        self.assertNotIsInstance(self.game_map.tiles, np.memmap)
+        self.assertNotIsInstance(self.game_map.visible, np.memmap)
+
+    def test_layers_mapped_to_files(self):
+        """Each layer is backed by a Fortran-order .npy file in the storage directory."""
+        game_map = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+
+        for name in ('tiles', 'visible', 'explored'):
+            layer = getattr(game_map, name)
+            self.assertIsInstance(layer, np.memmap)
+            self.assertEqual(layer.shape, (12, 8))
+            self.assertTrue(layer.flags.f_contiguous)
+            self.assertTrue((game_map.layer_dir / f'{name}.npy').exists())
+        self.assertEqual(game_map.layer_dir.parent, self.storage_dir)
+
+    def test_mapped_map_starts_as_unseen_walls(self):
+        """A new mapped map is all walls, nothing visible or explored."""
+        game_map = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+
+        self.assertTrue((game_map.tiles == tile_types.wall).all())
+        self.assertFalse(game_map.visible.any())
+        self.assertFalse(game_map.explored.any())
+
+    def test_flush_writes_layers_to_disk(self):
+        """Flushed changes can be read back from the layer files."""
+        game_map = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+        game_map.tiles[3, 4] = tile_types.floor
+        game_map.explored[5, 6] = True
+
+        game_map.flush()
+
+        self.assertTrue(np.load(game_map.layer_dir / 'tiles.npy', mmap_mode='r')['walkable'][3, 4])
+        self.assertTrue(np.load(game_map.layer_dir / 'explored.npy', mmap_mode='r')[5, 6])
+
+    def test_live_maps_do_not_share_layers(self):
+        """Two floors mapped under one storage directory keep their own tiles."""
+        first = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+        first.tiles[3, 4] = tile_types.floor
+        first.explored[3, 4] = True
+
+        second = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+        second.tiles[6, 2] = tile_types.floor
+
+        self.assertNotEqual(first.layer_dir, second.layer_dir)
+        self.assertTrue(first.tiles['walkable'][3, 4])
+        self.assertFalse(first.tiles['walkable'][6, 2])
+        self.assertTrue(first.explored[3, 4])
+        self.assertFalse(second.tiles['walkable'][3, 4])
+        self.assertFalse(second.explored.any())
+
+    def test_discarded_map_removes_its_files(self):
+        """A mapped floor's layer directory goes away with the map."""
+        game_map = GameMap(self.engine, 12, 8, entities=[], storage_dir=self.storage_dir)
+        layer_dir = game_map.layer_dir
+
+        del game_map
+        gc.collect()
+
+        self.assertFalse(layer_dir.exists())
+
+    def test_generated_dungeon_uses_storage_dir(self):
+        """Dungeon generation carves rooms straight into the mapped tiles."""
+        dungeon = generate_dungeon(
+            max_rooms=5,
+            room_min_size=4,
+            room_max_size=6,
+            map_width=40,
+            map_height=30,
+            max_monsters_per_room=0,
+            max_items_per_room=0,
+            engine=self.engine,
+            storage_dir=self.storage_dir,
+        )
+
+        self.assertIsInstance(dungeon.tiles, np.memmap)
+        self.assertTrue(dungeon.tiles['walkable'].any())
+
+
+class TestGameMapRendering(GameTestCase):
+    """Test map rendering and its cached tile layer.
+
+    Business Logic:
+    - Visible tiles use light graphics, explored ones dark, the rest fog
+    - Idle frames reuse the composed layer instead of recomputing it
+    - Tile or visibility changes are picked up on the next frame
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.console = tcod.console.Console(self.game_map.width, self.game_map.height, order='F')
+
+    def test_render_uses_light_graphics_in_fov(self):
+        """Tiles in view are drawn with their light colors."""
+        self.engine.update_fov()
+        self.game_map.render(self.console)
+
+        bg = tuple(self.console.tiles_rgb['bg'][self.player.x + 1, self.player.y])
+        self.assertEqual(bg, tuple(tile_types.floor['light']['bg']))
+
+    def test_idle_frames_reuse_tile_layer(self):
+        """Rendering twice without changes reuses the cached layer."""
+        self.game_map.render(self.console)
+        layer = self.game_map._tile_layer
+        self.game_map.render(self.console)
+        self.assertIs(self.game_map._tile_layer, layer)
+
+    def test_fov_change_refreshes_tile_layer(self):
+        """A new FOV is reflected on the next frame."""
+        self.game_map.render(self.console)
+        self.engine.update_fov()
+        self.game_map.render(self.console)
+
+        bg = tuple(self.console.tiles_rgb['bg'][self.player.x, self.player.y])
+        self.assertEqual(bg, tuple(tile_types.floor['light']['bg']))
+
+    def test_tile_change_refreshes_tile_layer(self):
+        """Carving a wall is reflected on the next frame."""
+        self.engine.update_fov()
+        self.game_map.render(self.console)
+        self.make_tile_wall(self.player.x + 1, self.player.y)
+        self.game_map.render(self.console)
+
+        bg = tuple(self.console.tiles_rgb['bg'][self.player.x + 1, self.player.y])
+        self.assertEqual(bg, tuple(tile_types.wall['light']['bg']))
+
+    def glyph_at(self, x: int, y: int) -> str:
+        """Return the character drawn at a console position."""
+        return chr(self.console.tiles_rgb['ch'][x, y])
+
+    def test_entities_drawn_only_when_visible(self):
+        """Entities on tiles outside the FOV are not drawn."""
+        self.place_orc(2, 2)
+        self.set_visible(self.player.x, self.player.y)
+        self.game_map.render(self.console)
+
+        self.assertEqual(self.glyph_at(self.player.x, self.player.y), '@')
+        self.assertEqual(self.glyph_at(2, 2), ' ')
+
+    def test_actor_drawn_over_item(self):
+        """When an actor stands on an item, the actor is shown."""
+        self.place_orc(5, 5)
+        self.place_health_potion(5, 5)
+        self.make_area_visible(0, 0, 20, 20)
+        self.game_map.render(self.console)
+
+        self.assertEqual(self.glyph_at(5, 5), 'o')
+
+    def test_item_drawn_over_corpse(self):
+        """Items are shown on top of corpses."""
+        orc = self.place_orc(5, 5)
+        self.place_health_potion(5, 5)
+        self.make_area_visible(0, 0, 20, 20)
+        self.game_map.render(self.console)
+        orc.fighter.take_damage(orc.fighter.hp)
+        self.game_map.render(self.console)
+
+        self.assertEqual(self.glyph_at(5, 5), '!')
+
+    def test_moved_entity_drawn_at_new_position(self):
+        """Moving an entity after a frame draws it at its new tile."""
+        orc = self.place_orc(5, 5)
+        self.make_area_visible(0, 0, 20, 20)
+        self.game_map.render(self.console)
+        orc.move(1, 0)
+        self.game_map.render(self.console)
+
+        self.assertEqual(self.glyph_at(5, 5), ' ')
+        self.assertEqual(self.glyph_at(6, 5), 'o')
+
+    def test_removed_entity_not_drawn(self):
+        """Picking up or removing an entity clears it on the next frame."""
+        potion = self.place_health_potion(5, 5)
+        self.place_orc(7, 7)
+        self.make_area_visible(0, 0, 20, 20)
+        self.game_map.render(self.console)
+
+        self.game_map.entities.remove(potion)
+        self.console.clear()
+        self.game_map.render(self.console)
+
+        self.assertEqual(self.glyph_at(5, 5), ' ')
+        self.assertEqual(self.glyph_at(7, 7), 'o')
+
+
+class TestEntityRenderLayer(GameTestCase):
+    """Test the render-order grouping of the entity layer.
+
+    Business Logic:
+    - Rows stay grouped by render order, lowest first, through any mix of changes
+    - Every tracked entity's row holds its own position and glyph
+    """
+
+    def assertLayerConsistent(self) -> None:
+        layer = self.game_map._entity_layer
+        orders = [entity.render_order.value for entity in layer._rows[:layer.count]]
+        self.assertEqual(orders, sorted(orders))
+        self.assertEqual(set(layer._slots), set(self.game_map.entities))
+        for entity, slot in layer._slots.items():
+            self.assertIs(layer._rows[slot], entity)
+            self.assertEqual((layer.x[slot], layer.y[slot]), entity.position)
+            self.assertEqual(layer.ch[slot], ord(entity.icon))
+
+    def test_rows_stay_grouped_through_changes(self):
+        """Adds, deaths, moves and removals keep the runs contiguous and in order."""
+        rng = random.Random(7)
+        for step in range(300):
+            entities = list(self.game_map.entities)
+            roll = rng.random()
+            if roll < 0.4:
+                place = self.place_orc if rng.random() < 0.5 else self.place_health_potion
+                place(rng.randrange(20), rng.randrange(20))
+            elif roll < 0.6:
+                orcs = [entity for entity in self.game_map.actors if entity is not self.player]
+                if orcs:
+                    orc = rng.choice(orcs)
+                    orc.fighter.take_damage(orc.fighter.hp)
+            elif roll < 0.8 and len(entities) > 1:
+                entity = rng.choice(entities)
+                if entity is not self.player:
+                    self.game_map.entities.remove(entity)
+            else:
+                self.player.place(rng.randrange(20), rng.randrange(20))
+            with self.subTest(step=step):
+                self.assertLayerConsistent()
+
+
 class TestRectangularRoom(unittest.TestCase):
     """Test RectangularRoom for dungeon generation."""
 
@@ -236,7 +694,7 @@ class TestTunnelBetween(unittest.TestCase):
         """Tunnel includes both endpoints."""
         start = (0, 0)
         end = (5, 5)
-        tunnel = list(tunnel_between(start, end))
+        tunnel = list(tunnel_between(start, end, random.Random(0)))
         self.assertIn((0, 0), tunnel)
         self.assertIn((5, 5), tunnel)
 
@@ -244,7 +702,7 @@ class TestTunnelBetween(unittest.TestCase):
         """Tunnel forms a connected path (L-shaped)."""
         start = (0, 0)
         end = (5, 3)
-        tunnel = list(tunnel_between(start, end))
+        tunnel = list(tunnel_between(start, end, random.Random(0)))
 
         # Verify all points are present for an L-shaped path
         # Could go horizontal then vertical, or vertical then horizontal
@@ -370,6 +828,28 @@ class TestDungeonGeneration(GameTestCase):
         player_x, player_y = self.player.x, self.player.y
         self.assertTrue(dungeon.tiles['walkable'][player_x, player_y])
 
+    def test_same_seed_generates_same_dungeon(self):
+        """Two engines with the same seed generate identical floors."""
+        def generate(seed):
+            engine = GameFactory.create_game(config=GameConfig(seed=seed)).engine
+            dungeon = generate_dungeon(
+                max_rooms=10,
+                room_min_size=4,
+                room_max_size=8,
+                map_width=50,
+                map_height=40,
+                max_monsters_per_room=3,
+                max_items_per_room=3,
+                engine=engine,
+            )
+            return dungeon.tiles.copy(), [(entity.name, entity.x, entity.y) for entity in dungeon.entities]
+
+        first_tiles, first_entities = generate(7)
+        second_tiles, second_entities = generate(7)
+
+        self.assertTrue((first_tiles == second_tiles).all())
+        self.assertEqual(first_entities, second_entities)
+
 
 class TestTileTypes(unittest.TestCase):
     """Test tile type definitions."""
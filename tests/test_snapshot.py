@@ -0,0 +1,223 @@
+"""Tests for binary save snapshots.
+
+These tests verify the behavior of:
+- encode/decode: round-tripping an engine through snapshot bytes
+- save/load: writing snapshots to disk
+- Rejecting files that are not valid snapshots
+
+Business Logic Tested:
+- A loaded game has the same floor, entities, stats, AI state, clock and messages
+- Corpses, confused monsters and carried items survive a save
+- Re-encoding a loaded game gives identical bytes
+- The game's random sequence continues where it left off
+- Damaged, foreign or newer files raise InvalidSaveError
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import numpy as np
+
+import snapshot
+from components.ai import ConfusedEnemy, HostileEnemy
+from components.confusion_consumable import ConfusionConsumable
+from exceptions import InvalidSaveError
+from message_log import MessageLog, read_journal
+from tests.factories import GameFactory
+from tests.helpers import GameTestCase
+
+
+class TestSnapshotRoundTrip(GameTestCase):
+    """Test restoring an engine from its snapshot."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.make_tile_wall(3, 4)
+        self.engine.update_fov()
+
+    def round_trip(self):
+        engine = snapshot.decode(snapshot.encode(self.engine), self.engine.config)
+        return engine, engine.game_map
+
+    def test_map_layers_are_restored(self):
+        """Tiles, visible and explored come back unchanged."""
+        _, game_map = self.round_trip()
+
+        np.testing.assert_array_equal(game_map.tiles, self.game_map.tiles)
+        np.testing.assert_array_equal(game_map.visible, self.game_map.visible)
+        np.testing.assert_array_equal(game_map.explored, self.game_map.explored)
+
+    def test_player_and_monsters_are_restored(self):
+        """The player and monsters keep their positions, names and stats."""
+        orc = self.place_orc(12, 10)
+        orc.fighter.hp -= 3
+
+        engine, game_map = self.round_trip()
+
+        self.assertEqual(engine.player.position, self.player.position)
+        self.assertIn(engine.player, game_map.entities)
+        loaded_orc = game_map.get_actor_at_location(12, 10)
+        self.assertEqual(loaded_orc.name, orc.name)
+        self.assertEqual(
+            (loaded_orc.fighter.hp, loaded_orc.fighter.max_hp, loaded_orc.fighter.power, loaded_orc.fighter.defense),
+            (orc.fighter.hp, orc.fighter.max_hp, orc.fighter.power, orc.fighter.defense),
+        )
+
+    def test_corpse_stays_dead(self):
+        """A corpse loads without AI, without blocking and with its remains name."""
+        orc = self.place_orc(12, 10)
+        orc.fighter.take_damage(orc.fighter.hp)
+
+        _, game_map = self.round_trip()
+
+        corpse = next(game_map.get_entities_at(12, 10))
+        self.assertIsNone(corpse.ai)
+        self.assertFalse(corpse.blocks_movement)
+        self.assertEqual(corpse.name, orc.name)
+
+    def test_ai_state_is_restored(self):
+        """Hostile paths and confusion, with the AI it wraps, are kept."""
+        chaser = self.place_orc(12, 12)
+        chaser.ai.path = deque([(11, 11), (10, 11)])
+        confused = self.place_orc(8, 8)
+        confused.ai = ConfusedEnemy(confused, confused.ai, turns_remaining=4)
+
+        _, game_map = self.round_trip()
+
+        loaded_chaser = game_map.get_actor_at_location(12, 12)
+        self.assertEqual(loaded_chaser.ai.path, deque([(11, 11), (10, 11)]))
+        loaded_confused = game_map.get_actor_at_location(8, 8)
+        self.assertIsInstance(loaded_confused.ai, ConfusedEnemy)
+        self.assertEqual(loaded_confused.ai.turns_remaining, 4)
+        self.assertIsInstance(loaded_confused.ai.previous_ai, HostileEnemy)
+        self.assertIs(loaded_confused.ai.previous_ai.entity, loaded_confused)
+
+    def test_items_on_floor_and_in_inventory_are_restored(self):
+        """Items keep their consumable settings wherever they are."""
+        self.place_health_potion(5, 5)
+        self.add_item_to_inventory(GameFactory.create_confusion_scroll(number_of_turns=7))
+
+        engine, game_map = self.round_trip()
+
+        self.assertEqual([item.name for item in game_map.items], ['Health Potion'])
+        (scroll,) = engine.player.inventory.items
+        self.assertIsInstance(scroll.consumable, ConfusionConsumable)
+        self.assertEqual(scroll.consumable.number_of_turns, 7)
+        self.assertIs(scroll.parent, engine.player.inventory)
+
+    def test_clock_and_turn_order_are_restored(self):
+        """Queued monsters act in the same order and dormant ones stay parked."""
+        first = self.place_orc(12, 10)
+        second = self.place_orc(8, 10)
+        self.engine.handle_enemy_turns()
+        self.engine.scheduler.park(second)
+
+        engine, game_map = self.round_trip()
+
+        loaded_first = game_map.get_actor_at_location(first.x, first.y)
+        loaded_second = game_map.get_actor_at_location(second.x, second.y)
+        self.assertEqual(engine.scheduler.time, self.engine.scheduler.time)
+        (_, time), = self.engine.scheduler.queued()
+        self.assertEqual(engine.scheduler.queued(), [(loaded_first, time)])
+        self.assertIn(loaded_second, engine.scheduler.dormant)
+
+    def test_messages_are_restored(self):
+        """The message log keeps its text, colors and stack counts."""
+        self.engine.message_log.add_message('Hit!', (255, 0, 0))
+        self.engine.message_log.add_message('Hit!', (255, 0, 0))
+
+        engine, _ = self.round_trip()
+
+        last = engine.message_log.messages[-1]
+        self.assertEqual((last.plain_text, last.fg, last.count), ('Hit!', (255, 0, 0), 2))
+
+    def test_random_sequence_continues(self):
+        """The loaded engine draws the same random numbers the saved one would have."""
+        self.engine.rng.random()
+        engine, _ = self.round_trip()
+
+        self.assertEqual(engine.rng.random(), self.engine.rng.random())
+
+    def test_reencoding_is_identical(self):
+        """Saving a loaded game reproduces the original bytes."""
+        self.place_orc(12, 10)
+        self.engine.handle_enemy_turns()
+        data = snapshot.encode(self.engine)
+
+        self.assertEqual(snapshot.encode(snapshot.decode(data, self.engine.config)), data)
+
+    def test_save_and_load_file(self):
+        """save writes a file that load reads back."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'game.sav'
+            snapshot.save(self.engine, path)
+            engine = snapshot.load(path, self.engine.config)
+
+        self.assertEqual(engine.player.position, self.player.position)
+
+    def test_save_flushes_message_journal(self):
+        """Messages spilled before a save are on disk even if the game never closes the log."""
+        with tempfile.TemporaryDirectory() as directory:
+            journal_path = Path(directory) / 'journal.bin'
+            self.engine.message_log = MessageLog(capacity=5, journal_path=journal_path)
+            for index in range(50):
+                self.engine.message_log.add_message(f'Message {index}')
+
+            snapshot.save(self.engine, Path(directory) / 'game.sav')
+            spilled = list(read_journal(journal_path))
+            self.engine.message_log.close()
+
+        self.assertEqual(len(spilled), 45)
+
+    def test_long_messages_are_restored(self):
+        """Messages over 64 KiB, such as tracebacks, survive a save."""
+        self.engine.message_log.add_message('x' * 70_000)
+
+        engine, _ = self.round_trip()
+
+        self.assertEqual(engine.message_log.messages[-1].plain_text, 'x' * 70_000)
+
+    def test_load_into_mapped_layers(self):
+        """With a map storage directory the loaded floor's layers are memory-mapped."""
+        with tempfile.TemporaryDirectory() as directory:
+            config = replace(self.engine.config, map_storage_dir=Path(directory))
+            engine = snapshot.decode(snapshot.encode(self.engine), config)
+
+            self.assertIsInstance(engine.game_map.tiles, np.memmap)
+            np.testing.assert_array_equal(engine.game_map.tiles, self.game_map.tiles)
+            np.testing.assert_array_equal(engine.game_map.explored, self.game_map.explored)
+
+
+class TestInvalidSnapshots(unittest.TestCase):
+    """Test rejecting data that is not a loadable snapshot."""
+
+    def setUp(self) -> None:
+        self.data = snapshot.encode(GameFactory.create_game().engine)
+
+    def test_wrong_magic_is_rejected(self):
+        """Files without the snapshot magic are refused."""
+        with self.assertRaisesRegex(InvalidSaveError, 'Not a save file'):
+            snapshot.decode(b'PICKLED!' + self.data[8:])
+
+    def test_other_version_is_rejected(self):
+        """Snapshots from another format version are refused."""
+        data = snapshot.HEADER.pack(snapshot.MAGIC, snapshot.VERSION + 1) + self.data[snapshot.HEADER.size:]
+        with self.assertRaisesRegex(InvalidSaveError, 'Unsupported save version'):
+            snapshot.decode(data)
+
+    def test_truncated_snapshot_is_rejected(self):
+        """A cut-off file raises InvalidSaveError rather than a low-level error."""
+        with self.assertRaises(InvalidSaveError):
+            snapshot.decode(self.data[: len(self.data) // 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for the turn scheduler.
+
+These tests verify the behavior of:
+- TurnScheduler: heap ordering, rescheduling and due-time limits
+- action_delay: speed to clock-tick conversion
+
+Business Logic Tested:
+- Earlier action times go first; ties go in scheduling order
+- Rescheduled or unscheduled actors do not act on their old entries
+- Faster actors act more often
+"""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from tests.factories import GameFactory
+from turn_scheduler import NORMAL_SPEED, TURN_LENGTH, TurnScheduler, action_delay
+
+
+class TestActionDelay(unittest.TestCase):
+    """Test converting speeds to delays."""
+
+    def test_normal_speed_takes_one_turn(self):
+        """A normal-speed actor acts once per turn length."""
+        self.assertEqual(action_delay(NORMAL_SPEED), TURN_LENGTH)
+
+    def test_double_speed_halves_delay(self):
+        """Twice the speed means half the delay."""
+        self.assertEqual(action_delay(NORMAL_SPEED * 2), TURN_LENGTH // 2)
+
+    def test_delay_is_always_positive(self):
+        """Absurd speeds still advance the clock."""
+        self.assertEqual(action_delay(10**9), 1)
+        self.assertGreater(action_delay(0), 0)
+
+
+class TestTurnScheduler(unittest.TestCase):
+    """Test TurnScheduler ordering and bookkeeping."""
+
+    def setUp(self) -> None:
+        self.first = GameFactory.create_orc()
+        self.second = GameFactory.create_orc()
+        self.third = GameFactory.create_orc()
+
+    def drain(self, scheduler, end_time):
+        order = []
+        while (due := scheduler.pop_due(end_time)) is not None:
+            order.append(due)
+        return order
+
+    def test_ties_go_in_scheduling_order(self):
+        """Actors scheduled for the same time act in the order they were added."""
+        scheduler = TurnScheduler([self.first, self.second, self.third])
+        self.assertEqual(
+            self.drain(scheduler, 1),
+            [(self.first, 0), (self.second, 0), (self.third, 0)],
+        )
+
+    def test_earlier_time_goes_first(self):
+        """A later-scheduled actor with an earlier time acts first."""
+        scheduler = TurnScheduler()
+        scheduler.schedule(self.first, 50)
+        scheduler.schedule(self.second, 10)
+        self.assertEqual(self.drain(scheduler, 100), [(self.second, 10), (self.first, 50)])
+
+    def test_actors_not_due_stay_scheduled(self):
+        """Only entries before end_time are popped."""
+        scheduler = TurnScheduler()
+        scheduler.schedule(self.first, 150)
+        self.assertEqual(self.drain(scheduler, 100), [])
+        self.assertIn(self.first, scheduler)
+
+    def test_rescheduling_replaces_old_entry(self):
+        """An actor acts once, at its latest scheduled time."""
+        scheduler = TurnScheduler([self.first])
+        scheduler.schedule(self.first, 30)
+        self.assertEqual(self.drain(scheduler, 100), [(self.first, 30)])
+
+    def test_unscheduled_actor_is_skipped(self):
+        """Unscheduling leaves a stale entry that never comes up."""
+        scheduler = TurnScheduler([self.first, self.second])
+        scheduler.unschedule(self.first)
+        self.assertEqual(self.drain(scheduler, 100), [(self.second, 0)])
+        self.assertEqual(len(scheduler), 0)
+
+
+    def test_parked_actor_is_dormant_until_woken(self):
+        """Parking takes an actor off the schedule; waking puts it back at the current time."""
+        scheduler = TurnScheduler([self.first, self.second])
+        scheduler.time = 40
+        scheduler.park(self.first)
+        self.assertIn(self.first, scheduler.dormant)
+        self.assertEqual(self.drain(scheduler, 100), [(self.second, 0)])
+
+        scheduler.wake(self.first)
+        self.assertNotIn(self.first, scheduler.dormant)
+        self.assertEqual(self.drain(scheduler, 100), [(self.first, 40)])
+
+    def test_waking_scheduled_actor_does_nothing(self):
+        """Only dormant actors are rescheduled by wake."""
+        scheduler = TurnScheduler()
+        scheduler.schedule(self.first, 70)
+        scheduler.wake(self.first)
+        self.assertEqual(self.drain(scheduler, 100), [(self.first, 70)])
+
+if __name__ == '__main__':
+    unittest.main()